@@ -33,6 +33,8 @@
     "website": "https://www.cybrosys.com",
     "depends": ["hr_holidays", "hr", "hr_attendance"],
     "data": [
+        "security/ir.model.access.csv",
+        "data/ir_cron_data.xml",
         "views/hr_leave_type_views.xml",
         "views/advance_hr_attendance_dashboard_menus.xml",
         "views/res_config_settings_views.xml",
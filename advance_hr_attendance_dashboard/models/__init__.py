@@ -20,3 +20,6 @@
 from . import hr_employee
 from . import hr_leave_type
 from . import res_config_settings
+from . import hr_attendance
+from . import hr_attendance_day_status
+from . import hr_leave
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Gayathri V(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+###############################################################################
+from odoo import api, models
+
+
+class HrAttendance(models.Model):
+    """Keeps the stored daily statuses of the dashboard in sync when
+    attendances of past days are recorded, edited or deleted."""
+    _inherit = 'hr.attendance'
+
+    def _mark_day_status(self):
+        self.env['hr.attendance.day.status']._mark_cells(
+            (attendance.employee_id.id, attendance.check_in.date())
+            for attendance in self if attendance.check_in)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        attendances = super().create(vals_list)
+        attendances._mark_day_status()
+        return attendances
+
+    def write(self, vals):
+        if 'employee_id' in vals or 'check_in' in vals:
+            self._mark_day_status()
+        res = super().write(vals)
+        if 'employee_id' in vals or 'check_in' in vals:
+            self._mark_day_status()
+        return res
+
+    def unlink(self):
+        self._mark_day_status()
+        return super().unlink()
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Gayathri V(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+###############################################################################
+from datetime import timedelta
+from odoo import api, fields, models, tools
+
+# Days stored at once when the scheduled action fills closed days
+FILL_CHUNK_DAYS = 31
+
+
+class HrAttendanceDayStatus(models.Model):
+    """Attendance status of an employee on a closed day (present, absent or
+    on leave). The dashboard reads historical ranges from this table and
+    only computes the current day live. Cells are filled by a nightly
+    scheduled action and refreshed whenever an attendance or a time off of
+    a past day changes."""
+    _name = 'hr.attendance.day.status'
+    _description = 'Attendance Day Status'
+    _order = 'date desc, employee_id'
+
+    employee_id = fields.Many2one('hr.employee', required=True,
+                                  readonly=True, ondelete='cascade')
+    date = fields.Date(required=True, readonly=True)
+    status = fields.Selection([('present', 'Present'),
+                               ('absent', 'Absent'),
+                               ('leave', 'Leave')],
+                              required=True, readonly=True)
+    leave_type_id = fields.Many2one('hr.leave.type', readonly=True,
+                                    ondelete='cascade')
+
+    _sql_constraints = [
+        ('employee_date_uniq', 'unique (employee_id, date)',
+         'Only one status per employee and day.'),
+    ]
+
+    def init(self):
+        tools.create_index(self._cr, 'hr_attendance_day_status_date_index',
+                           self._table, ['date'])
+
+    @api.model
+    def _compute_statuses(self, employee_ids, dates):
+        """Return ``{(employee_id, date): (status, leave_type_id)}`` for the
+        given employees and days. A validated time off takes precedence over
+        the attendances of the day."""
+        if not employee_ids or not dates:
+            return {}
+        self.env['hr.attendance'].flush_model(['employee_id', 'check_in'])
+        self.env['hr.leave'].flush_model(
+            ['employee_id', 'state', 'holiday_status_id',
+             'request_date_from', 'request_date_to'])
+        date_from, date_to = min(dates), max(dates)
+        self._cr.execute("""
+            SELECT employee_id, check_in::date
+            FROM hr_attendance
+            WHERE employee_id = ANY(%s)
+              AND check_in >= %s AND check_in < %s
+            GROUP BY employee_id, check_in::date
+        """, (list(employee_ids), date_from, date_to + timedelta(days=1)))
+        present = set(self._cr.fetchall())
+        self._cr.execute("""
+            SELECT employee_id, request_date_from, request_date_to,
+                   holiday_status_id
+            FROM hr_leave
+            WHERE state = 'validate'
+              AND employee_id = ANY(%s)
+              AND request_date_from <= %s AND request_date_to >= %s
+            ORDER BY request_date_from
+        """, (list(employee_ids), date_to, date_from))
+        leaves = {}
+        for employee_id, leave_from, leave_to, leave_type_id \
+                in self._cr.fetchall():
+            day = max(leave_from, date_from)
+            while day <= min(leave_to, date_to):
+                leaves[employee_id, day] = leave_type_id
+                day += timedelta(days=1)
+        statuses = {}
+        for employee_id in employee_ids:
+            for day in dates:
+                if (employee_id, day) in leaves:
+                    statuses[employee_id, day] = (
+                        'leave', leaves[employee_id, day])
+                elif (employee_id, day) in present:
+                    statuses[employee_id, day] = ('present', None)
+                else:
+                    statuses[employee_id, day] = ('absent', None)
+        return statuses
+
+    @api.model
+    def _store_statuses(self, statuses):
+        """Insert or update the cells of ``statuses`` (as returned by
+        :meth:`_compute_statuses`)."""
+        if not statuses:
+            return
+        keys = list(statuses)
+        self._cr.execute("""
+            INSERT INTO hr_attendance_day_status
+                (employee_id, date, status, leave_type_id,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT k.employee_id, k.date, k.status, k.leave_type_id,
+                   %(uid)s, NOW() AT TIME ZONE 'UTC',
+                   %(uid)s, NOW() AT TIME ZONE 'UTC'
+            FROM unnest(%(employee_ids)s::int[], %(dates)s::date[],
+                        %(statuses)s::varchar[], %(leave_type_ids)s::int[])
+                AS k(employee_id, date, status, leave_type_id)
+            ON CONFLICT (employee_id, date) DO UPDATE
+            SET status = EXCLUDED.status,
+                leave_type_id = EXCLUDED.leave_type_id,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+        """, {
+            'uid': self.env.uid,
+            'employee_ids': [employee_id for employee_id, day in keys],
+            'dates': [day for employee_id, day in keys],
+            'statuses': [statuses[key][0] for key in keys],
+            'leave_type_ids': [statuses[key][1] for key in keys],
+        })
+        self.invalidate_model()
+
+    @api.model
+    def _refresh(self, keys):
+        """Recompute the given ``(employee_id, date)`` cells. Only closed days
+        are stored, the current day is always computed live."""
+        today = fields.Date.context_today(self)
+        keys = {(employee_id, day) for employee_id, day in keys
+                if day < today}
+        per_employee = {}
+        for employee_id, day in keys:
+            per_employee.setdefault(employee_id, set()).add(day)
+        statuses = {}
+        for employee_id, days in per_employee.items():
+            computed = self._compute_statuses([employee_id], sorted(days))
+            statuses.update({key: value for key, value in computed.items()
+                             if key in keys})
+        self._store_statuses(statuses)
+
+    @api.model
+    def _mark_cells(self, keys):
+        """Schedule a refresh of the ``(employee_id, date)`` cells at the end
+        of the transaction."""
+        today = fields.Date.context_today(self)
+        keys = {(employee_id, day) for employee_id, day in keys
+                if employee_id and day and day < today}
+        if not keys:
+            return
+        data = self.env.cr.precommit.data
+        key = 'advance_hr_attendance_dashboard.day_status_keys'
+        if key not in data:
+            data[key] = set()
+            env = self.env
+
+            @self.env.cr.precommit.add
+            def refresh_day_status():
+                env['hr.attendance.day.status'].sudo()._refresh(
+                    data.pop(key, set()))
+        data[key].update(keys)
+
+    @api.model
+    def _get_statuses(self, employee_ids, dates):
+        """Return the status of every employee on every day: closed days are
+        read from the table, the current and future days as well as the
+        closed days not stored yet are computed live. Nothing is stored."""
+        today = fields.Date.context_today(self)
+        closed_dates = [day for day in dates if day < today]
+        statuses = {}
+        if closed_dates:
+            self.flush_model()
+            self._cr.execute("""
+                SELECT employee_id, date, status, leave_type_id
+                FROM hr_attendance_day_status
+                WHERE employee_id = ANY(%s) AND date = ANY(%s)
+            """, (list(employee_ids), closed_dates))
+            for employee_id, day, status, leave_type_id \
+                    in self._cr.fetchall():
+                statuses[employee_id, day] = (status, leave_type_id)
+            missing = [employee_id for employee_id in employee_ids
+                       if any((employee_id, day) not in statuses
+                              for day in closed_dates)]
+            for key, value in self._compute_statuses(
+                    missing, closed_dates).items():
+                statuses.setdefault(key, value)
+        statuses.update(self._compute_statuses(
+            employee_ids, [day for day in dates if day >= today]))
+        return statuses
+
+    @api.model
+    def _get_first_activity_date(self):
+        """Day of the first attendance or validated time off, if any."""
+        self.env['hr.attendance'].flush_model(['check_in'])
+        self.env['hr.leave'].flush_model(['state', 'request_date_from'])
+        self._cr.execute("""
+            SELECT LEAST(
+                (SELECT MIN(check_in)::date FROM hr_attendance),
+                (SELECT MIN(request_date_from) FROM hr_leave
+                 WHERE state = 'validate'))
+        """)
+        return self._cr.fetchone()[0]
+
+    @api.model
+    def _cron_fill_closed_days(self):
+        """Store the status of every employee for each closed day after the
+        last day stored for them, so that a skipped night leaves no gap.
+        Employees without any stored day start at the first attendance or
+        time off of the database; this also backfills the history when the
+        module is installed."""
+        yesterday = fields.Date.context_today(self) - timedelta(days=1)
+        self.flush_model()
+        self._cr.execute("""
+            SELECT employee_id, MAX(date)
+            FROM hr_attendance_day_status
+            GROUP BY employee_id
+        """)
+        last_dates = dict(self._cr.fetchall())
+        first_date = self._get_first_activity_date() or yesterday
+        employees_per_start = {}
+        for employee_id in self.env['hr.employee'].with_context(
+                active_test=False).search([]).ids:
+            start = last_dates[employee_id] + timedelta(days=1) \
+                if employee_id in last_dates else first_date
+            if start <= yesterday:
+                employees_per_start.setdefault(start, []).append(employee_id)
+        for start, employee_ids in employees_per_start.items():
+            day = start
+            while day <= yesterday:
+                chunk_end = min(day + timedelta(days=FILL_CHUNK_DAYS - 1),
+                                yesterday)
+                dates = [day + timedelta(days=offset)
+                         for offset in range((chunk_end - day).days + 1)]
+                self._store_statuses(
+                    self._compute_statuses(employee_ids, dates))
+                day = chunk_end + timedelta(days=1)
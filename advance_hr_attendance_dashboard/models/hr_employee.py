@@ -17,14 +17,17 @@
 #    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
 #    (AGPL v3) along with this program.
 ###############################################################################
-import re
-
-# import pandas
-from datetime import date, timedelta
+from datetime import timedelta
 from odoo import api, fields, models
-from odoo.http import request
 from odoo.tools import date_utils
 
+# Hex colours of the leave type colour indexes
+LEAVE_TYPE_COLORS = {
+    1: "#F06050", 2: "#F4A460", 3: "#F7CD1F", 4: "#6CC1ED",
+    5: "#814968", 6: "#EB7E7F", 7: "#2C8397", 8: "#475577",
+    9: "#D6145F", 10: "#30C381", 11: "#9365B8",
+}
+
 
 class HrEmployee(models.Model):
     """This module extends the 'hr.employee' model of  Odoo Employees Module.
@@ -33,96 +36,62 @@ class HrEmployee(models.Model):
     _inherit = 'hr.employee'
     _check_company_auto = True
 
+    # The dashboard scopes employees on the active companies
+    company_id = fields.Many2one(index=True)
+
+    @api.model
+    def _get_dashboard_dates(self, option):
+        """Days shown for the given filter option"""
+        today = fields.Date.context_today(self)
+        if option == 'this_week':
+            start = date_utils.start_of(today, 'week')
+            end = date_utils.end_of(today, 'week')
+        elif option == 'this_month':
+            start = date_utils.start_of(today, 'month')
+            end = date_utils.end_of(today, 'month')
+        elif option == 'last_15_days':
+            return [today - timedelta(days=day) for day in range(15)]
+        else:
+            return []
+        return [start + timedelta(days=day)
+                for day in range((end - start).days + 1)]
+
     @api.model
     def get_employee_leave_data(self, option):
-        """Returns data to the dashboard"""
+        """Returns data to the dashboard. Past days are read from the stored
+        daily statuses, only the current day is computed live."""
         employee_data = []
-        res_config = self.env['res.config.settings'].search([], limit=1,
-                                                            order='id desc')
-        dates = False
-        # if option == 'this_week':
-        #     dates = pandas.date_range(
-        #         date_utils.start_of(fields.Date.today(), 'week'),
-        #         date_utils.end_of(fields.Date.today(), 'week')
-        #         - timedelta(
-        #             days=0),
-        #         freq='d').strftime(
-        #         "%Y-%m-%d").tolist()
-        # elif option == 'this_month':
-        #     dates = pandas.date_range(
-        #         date_utils.start_of(fields.Date.today(), 'month'),
-        #         date_utils.end_of(fields.Date.today(), 'month')
-        #         - timedelta(
-        #             days=0),
-        #         freq='d').strftime(
-        #         "%Y-%m-%d").tolist()
-        # elif option == 'last_15_days':
-        #     dates = [str(date.today() - timedelta(days=day))
-        #              for day in range(15)]
-
-        cids = request.httprequest.cookies.get('cids', '')
-        split_cids = re.split(r'[,-]', cids)
-        allowed_company_ids = [int(cid) for cid in split_cids if cid.isdigit()]
-        for employee in self.env['hr.employee'].search(
-                [('company_id', '=', allowed_company_ids)]):
+        ICP = self.env['ir.config_parameter'].sudo()
+        present_mark = ICP.get_param('advance_hr_attendance_dashboard.present')
+        absent_mark = ICP.get_param('advance_hr_attendance_dashboard.absent')
+        dates = self._get_dashboard_dates(option)
+        employees = self.env['hr.employee'].search(
+            [('company_id', 'in', self.env.companies.ids)])
+        statuses = self.env['hr.attendance.day.status'].sudo()._get_statuses(
+            employees.ids, dates)
+        leave_types = self.env['hr.leave.type'].sudo().browse(
+            {leave_type_id for status, leave_type_id in statuses.values()
+             if leave_type_id})
+        leave_marks = {leave_type.id: (leave_type.leave_code,
+                                       LEAVE_TYPE_COLORS.get(leave_type.color,
+                                                             "#ffffff"))
+                       for leave_type in leave_types}
+        for employee in employees:
             leave_data = []
-            employee_present_dates = []
-            employee_leave_dates = []
             total_absent_count = 0
-            query = ("""
-                SELECT hl.id,employee_id,request_date_from,request_date_to,
-                hlt.leave_code,hlt.color
-                FROM hr_leave hl
-				INNER JOIN hr_leave_type hlt ON hlt.id = hl.holiday_status_id 
-                WHERE hl.state = 'validate' AND employee_id = '%s'"""
-                     % employee.id)
-            self._cr.execute(query)
-            all_leave_rec = self._cr.dictfetchall()
-            # for leave in all_leave_rec:
-            #     leave_dates = pandas.date_range(
-            #         leave.get('request_date_from'),
-            #         leave.get('request_date_to') - timedelta(
-            #             days=0),
-            #         freq='d').strftime(
-            #         "%Y-%m-%d").tolist()
-            #     leave_dates.insert(0, leave.get('leave_code'))
-            #     leave_dates.insert(1, leave.get('color'))
-            #     for leave_date in leave_dates:
-            #         if leave_date in dates:
-            #             employee_leave_dates.append(
-            #                 leave_date
-            #             )
-            for employee_check_in in employee.attendance_ids:
-                employee_present_dates.append(
-                    str(employee_check_in.check_in.date()))
             for leave_date in dates:
                 color = "#ffffff"
-                marks = self.env[
-                    'res.config.settings'].search([], limit=1)
-                state = None
-                if marks:
-                    if leave_date in employee_present_dates:
-                        state = res_config.present
-                    else:
-                        state = res_config.absent
-                if leave_date in employee_leave_dates:
-                    state = leave_dates[0]
-                    color = "#F06050" if leave_dates[1] == 1 \
-                        else "#F4A460" if leave_dates[1] == 2 \
-                        else "#F7CD1F" if leave_dates[1] == 3 \
-                        else "#6CC1ED" if leave_dates[1] == 4 \
-                        else "#814968" if leave_dates[1] == 5 \
-                        else "#EB7E7F" if leave_dates[1] == 6 \
-                        else "#2C8397" if leave_dates[1] == 7 \
-                        else "#475577" if leave_dates[1] == 8 \
-                        else "#D6145F" if leave_dates[1] == 9 \
-                        else "#30C381" if leave_dates[1] == 10 \
-                        else "#9365B8" if leave_dates[1] == 11 \
-                        else "#ffffff"
+                status, leave_type_id = statuses[employee.id, leave_date]
+                if status == 'leave':
+                    state, color = leave_marks[leave_type_id]
                     total_absent_count += 1
+                elif status == 'present':
+                    state = present_mark
+                else:
+                    state = absent_mark
                 leave_data.append({
                     'id': employee.id,
-                    'leave_date': leave_date,
+                    'leave_date': str(leave_date),
                     'state': state,
                     'color': color
                 })
@@ -134,5 +103,5 @@ class HrEmployee(models.Model):
             })
         return {
             'employee_data': employee_data,
-            'filtered_duration_dates': dates[::-1]
+            'filtered_duration_dates': [str(day) for day in dates[::-1]]
         }
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Gayathri V(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+###############################################################################
+from datetime import timedelta
+from odoo import api, models
+
+# Fields changing the days a time off covers on the dashboard
+DAY_STATUS_FIELDS = ('employee_id', 'state', 'holiday_status_id',
+                     'request_date_from', 'request_date_to')
+
+
+class HrLeave(models.Model):
+    """Keeps the stored daily statuses of the dashboard in sync when time off
+    covering past days is validated, edited, refused or deleted."""
+    _inherit = 'hr.leave'
+
+    def _mark_day_status(self):
+        keys = set()
+        for leave in self:
+            if not (leave.employee_id and leave.request_date_from
+                    and leave.request_date_to):
+                continue
+            day = leave.request_date_from
+            while day <= leave.request_date_to:
+                keys.add((leave.employee_id.id, day))
+                day += timedelta(days=1)
+        self.env['hr.attendance.day.status']._mark_cells(keys)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        leaves = super().create(vals_list)
+        leaves.filtered(
+            lambda leave: leave.state == 'validate')._mark_day_status()
+        return leaves
+
+    def write(self, vals):
+        tracked = any(field in vals for field in DAY_STATUS_FIELDS)
+        if tracked:
+            self._mark_day_status()
+        res = super().write(vals)
+        if tracked:
+            self._mark_day_status()
+        return res
+
+    def unlink(self):
+        self._mark_day_status()
+        return super().unlink()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Gayathri V(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+###############################################################################
+from datetime import datetime, time, timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceDayStatus(TransactionCase):
+    """The stored statuses of past days follow the attendances and time off
+    recorded, edited or deleted afterwards."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.DayStatus = cls.env['hr.attendance.day.status']
+        cls.employee = cls.env['hr.employee'].create({'name': 'Day Status Employee'})
+        cls.leave_type = cls.env['hr.leave.type'].create({
+            'name': 'Day Status Leave',
+            'leave_code': 'SL',
+            'requires_allocation': 'no',
+            'leave_validation_type': 'hr',
+        })
+        today = fields.Date.context_today(cls.DayStatus)
+        # Monday and Tuesday of last week, working days in the past
+        cls.day_1 = today - timedelta(days=today.weekday() + 7)
+        cls.day_2 = cls.day_1 + timedelta(days=1)
+        cls.DayStatus._store_statuses(cls.DayStatus._compute_statuses(
+            cls.employee.ids, [cls.day_1, cls.day_2]))
+
+    def _status(self, day):
+        """Run the end-of-transaction refresh and return the stored cell."""
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        cell = self.DayStatus.search([
+            ('employee_id', '=', self.employee.id),
+            ('date', '=', day),
+        ])
+        return cell.status, cell.leave_type_id
+
+    def _create_attendance(self, day):
+        return self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': datetime.combine(day, time(9)),
+            'check_out': datetime.combine(day, time(17)),
+        })
+
+    def test_attendance_hooks(self):
+        self.assertEqual(self._status(self.day_1)[0], 'absent')
+        attendance = self._create_attendance(self.day_1)
+        self.assertEqual(self._status(self.day_1)[0], 'present')
+
+        attendance.write({
+            'check_in': datetime.combine(self.day_2, time(9)),
+            'check_out': datetime.combine(self.day_2, time(17)),
+        })
+        self.assertEqual(self._status(self.day_1)[0], 'absent')
+        self.assertEqual(self._status(self.day_2)[0], 'present')
+
+        attendance.unlink()
+        self.assertEqual(self._status(self.day_2)[0], 'absent')
+
+    def test_leave_hooks(self):
+        self._create_attendance(self.day_1)
+        leave = self.env['hr.leave'].create({
+            'employee_id': self.employee.id,
+            'holiday_status_id': self.leave_type.id,
+            'request_date_from': self.day_1,
+            'request_date_to': self.day_2,
+        })
+        # Time off waiting for approval does not change the days
+        self.assertEqual(self._status(self.day_1)[0], 'present')
+        self.assertEqual(self._status(self.day_2)[0], 'absent')
+
+        leave.action_validate()
+        self.assertEqual(self._status(self.day_1), ('leave', self.leave_type))
+        self.assertEqual(self._status(self.day_2), ('leave', self.leave_type))
+
+        leave.action_refuse()
+        self.assertEqual(self._status(self.day_1)[0], 'present')
+        self.assertEqual(self._status(self.day_2)[0], 'absent')
+
+    def test_current_day_is_not_stored(self):
+        today = fields.Date.context_today(self.DayStatus)
+        self.env['hr.attendance'].create({
+            'employee_id': self.employee.id,
+            'check_in': fields.Datetime.now() - timedelta(minutes=5),
+        })
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.assertFalse(self.DayStatus.search([
+            ('employee_id', '=', self.employee.id),
+            ('date', '=', today),
+        ]))
+        statuses = self.DayStatus._get_statuses(self.employee.ids, [today])
+        self.assertEqual(statuses[self.employee.id, today][0], 'present')
+
+    def test_read_does_not_store(self):
+        day = self.day_1 - timedelta(days=7)
+        statuses = self.DayStatus._get_statuses(self.employee.ids, [day])
+        self.assertEqual(statuses[self.employee.id, day][0], 'absent')
+        self.assertFalse(self.DayStatus.search([
+            ('employee_id', '=', self.employee.id),
+            ('date', '=', day),
+        ]))
+
+    def test_cron_fills_missing_days(self):
+        self.DayStatus.search([('employee_id', '=', self.employee.id)]).unlink()
+        self.DayStatus._store_statuses(self.DayStatus._compute_statuses(
+            self.employee.ids, [self.day_1]))
+        self.DayStatus._cron_fill_closed_days()
+        yesterday = fields.Date.context_today(self.DayStatus) - timedelta(days=1)
+        stored = self.DayStatus.search([
+            ('employee_id', '=', self.employee.id),
+            ('date', '>=', self.day_1),
+        ])
+        self.assertEqual(len(stored), (yesterday - self.day_1).days + 1)
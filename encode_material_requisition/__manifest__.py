@@ -23,7 +23,10 @@
         'security/ir.model.access.csv',
         'data/requisition_sequence_data.xml',
         'data/mail_template_data.xml',
+        'data/ir_cron_data.xml',
+        'data/rfq_rollup_data.xml',
         'views/material_requisition_views.xml',
+        'views/material_requisition_notification_views.xml',
         'views/project_integration_view.xml',
         'views/work_type_views.xml',
         'views/work_sub_type_views.xml',
@@ -1,4 +1,6 @@
 from . import material_requisition
 from . import project_project
 from . import purchase_order
-from . import work_type
\ No newline at end of file
+from . import work_type
+from . import material_requisition_notification
+from . import material_requisition_rfq_rollup
@@ -1,7 +1,17 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, Command, _
 from odoo.exceptions import UserError, ValidationError
 
 
+# transition -> (allowed source states, target state, required group)
+_TRANSITIONS = {
+    'submit': (('draft',), 'waiting', None),
+    'approve': (('waiting',), 'approved', 'encode_material_requisition.group_material_requisition_approver'),
+    'cancel': (('waiting',), 'cancelled', None),
+    'reset': (('waiting',), 'draft', None),
+    'material_arrived': (('in_progress',), 'material_arrived', 'encode_material_requisition.group_mark_material_arrived'),
+}
+
+
 class MaterialRequisition(models.Model):
     _name = 'material.requisition'
     _description = 'Material Requisition'
@@ -24,13 +34,21 @@ class MaterialRequisition(models.Model):
     material_arrived_date = fields.Datetime(string="Material Arrival Date", tracking=True)
     line_ids = fields.One2many('material.requisition.line', 'requisition_id', string="Lines", tracking=True)
     purchase_order_ids = fields.One2many('purchase.order', 'requisition_id', string='RFQs', tracking=True)
-    purchase_order_count = fields.Integer(compute='_compute_purchase_order_count', string='# of RFQs', tracking=True)
+    purchase_order_count = fields.Integer(compute='_compute_purchase_order_count', store=True, string='# of RFQs',
+                                          tracking=True)
     rfq_created = fields.Boolean(compute='_compute_purchase_order_count', store=True, string="RFQ Created",
                                  tracking=True)
+    first_rfq_date = fields.Datetime(compute='_compute_purchase_order_count', store=True, string="First RFQ Date")
+    last_rfq_date = fields.Datetime(compute='_compute_purchase_order_count', store=True, string="Last RFQ Date")
     work_type_id = fields.Many2one('work.type', string='Work Type')
 
     color = fields.Integer(string="Color", compute="_compute_color", store=True)
 
+    def init(self):
+        # Serves the per-project/per-state aggregates of the dashboards
+        tools.create_index(self._cr, 'material_requisition_project_state_index',
+                           self._table, ['project_id', 'state'])
+
     @api.depends('state')
     def _compute_color(self):
         for rec in self:
@@ -46,98 +64,203 @@ class MaterialRequisition(models.Model):
                 rec.color = 0  # default
 
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        vals_to_name = [vals for vals in vals_list if vals.get('name', _('New')) == _('New')]
+        for vals, name in zip(vals_to_name, self._reserve_names(len(vals_to_name))):
+            vals['name'] = name
+        requisitions = super().create(vals_list)
+
+        # Side effects run once for the whole batch, after the insert
+        requisitions._queue_notifications()
+        requisitions._notify_project_dashboards()
+
+        return requisitions
+
     @api.model
-    def create(self, vals):
-        if vals.get('name', _('New')) == _('New'):
-            vals['name'] = self.env['ir.sequence'].next_by_code('material.requisition') or _('New')
-        requisition = super().create(vals)
-        
-        # Send notification email for new requisitions
-        requisition._send_notification_email()
-        
-        return requisition
+    def _reserve_names(self, count):
+        """Reserve ``count`` consecutive MR numbers with a single sequence
+        call instead of one ``next_by_code`` per record."""
+        if not count:
+            return []
+        sequence = self.env['ir.sequence'].sudo().search([
+            ('code', '=', 'material.requisition'),
+            ('company_id', 'in', [self.env.company.id, False]),
+        ], order='company_id', limit=1)
+        if not sequence:
+            return [_('New')] * count
+        if sequence.use_date_range:
+            # Date range sub-sequences have their own counters, let the ORM handle them
+            return [sequence.next_by_id() for _i in range(count)]
+        if sequence.implementation == 'standard':
+            self.env.cr.execute("SELECT nextval(%s) FROM generate_series(1, %s)",
+                                ('ir_sequence_%03d' % sequence.id, count))
+            numbers = [row[0] for row in self.env.cr.fetchall()]
+        else:
+            self.env.cr.execute("""
+                UPDATE ir_sequence
+                   SET number_next = number_next + %(count)s * number_increment
+                 WHERE id = %(id)s
+             RETURNING number_next - %(count)s * number_increment, number_increment
+            """, {'count': count, 'id': sequence.id})
+            start, increment = self.env.cr.fetchone()
+            numbers = [start + i * increment for i in range(count)]
+            sequence.invalidate_recordset(['number_next'])
+        return [sequence.get_next_char(number) for number in numbers]
+
+    def write(self, vals):
+        projects = self.project_id
+        rollup = self.env['material.requisition.rfq.rollup']
+        if {'date', 'project_id', 'state'} & vals.keys():
+            rollup._mark_requisitions(self)
+        res = super().write(vals)
+        if {'date', 'project_id'} & vals.keys():
+            rollup._mark_requisitions(self)
+        self._notify_project_dashboards(projects)
+        return res
+
+    def unlink(self):
+        self.env['material.requisition.rfq.rollup']._mark_requisitions(self)
+        self._notify_project_dashboards()
+        return super().unlink()
+
+    def _notify_project_dashboards(self, projects=None):
+        """Push a live-update notification for the requisitions' projects when
+        a dashboard publishing them (encode_project_dashboard) is installed."""
+        projects = (projects or self.env['project.project']) | self.project_id
+        if hasattr(projects, '_notify_dashboard_changes'):
+            projects._notify_dashboard_changes()
 
     def action_submit(self):
-        self.write({'state': 'waiting'})
+        self._apply_transition('submit')
 
     def action_approve(self):
-        self.write({'state': 'approved'})
+        self._apply_transition('approve')
 
     def action_cancel(self):
-        self.write({'state': 'cancelled'})
+        self._apply_transition('cancel')
 
     def action_reset(self):
-        self.write({'state': 'draft'})
+        self._apply_transition('reset')
 
-    def action_create_rfq(self):
-        PurchaseOrder = self.env['purchase.order']
+    def _apply_transition(self, transition):
+        """Move all requisitions in ``self`` through ``transition`` (a key of
+        ``_TRANSITIONS``), e.g. from a list view at month-end.
 
-        # Group lines by vendor
-        vendor_lines_map = {}
-        for line in self.line_ids:
-            if not line.vendor_id:
-                continue
-            vendor_lines_map.setdefault(line.vendor_id.id, []).append(line)
-
-        rfqs = []
-        for vendor_id, lines in vendor_lines_map.items():
-            po_vals = {
-                'partner_id': vendor_id,
-                'origin': self.name,
-                'requisition_id': self.id,
-                'project_id': self.project_id.id if self.project_id else False,
-                'order_line': [],
-            }
-
-            for line in lines:
-                po_line_vals = {
-                    'product_id': line.product_id.id,
-                    'product_qty': line.product_uom_qty,
-                    'product_uom': line.product_uom.id,
-                    'price_unit': line.cost,
-                    'date_planned': fields.Datetime.now(),
-                }
-                po_vals['order_line'].append((0, 0, po_line_vals))
-
-            rfq = PurchaseOrder.create(po_vals)
-            rfqs.append(rfq)
+        Preconditions are checked for the whole recordset up front, with
+        set-based queries, and the state change is applied with a single
+        write, so each requisition gets one tracking message.
+        """
+        source_states, target_state, group = _TRANSITIONS[transition]
+        if group and not self.env.user.has_group(group):
+            raise UserError(_("You are not authorized to perform this action."))
+
+        invalid = self.filtered(lambda r: r.state not in source_states)
+        if invalid:
+            raise UserError(_("The following requisitions are not in a valid state for this action: %s")
+                            % ", ".join(invalid.mapped('name')))
+
+        vals = {'state': target_state}
+        if transition == 'material_arrived':
+            # At least one line of each requisition must have been received
+            received = self.env['material.requisition.line']._read_group(
+                [('requisition_id', 'in', self.ids), ('received_qty', '>', 0)],
+                ['requisition_id'])
+            missing = self - self.browse([requisition.id for requisition, in received])
+            if missing:
+                raise UserError(_("At least one line must have Received Qty > 0 before marking as received: %s")
+                                % ", ".join(missing.mapped('name')))
+            vals['material_arrived_date'] = fields.Datetime.now()
+
+        self.write(vals)
+        return True
+
+    def _prepare_rfq_vals(self, vendor_id, lines, date_planned):
+        self.ensure_one()
+        return {
+            'partner_id': vendor_id,
+            'origin': self.name,
+            'requisition_id': self.id,
+            'project_id': self.project_id.id if self.project_id else False,
+            'order_line': [(0, 0, {
+                'product_id': line.product_id.id,
+                'product_qty': line.product_uom_qty,
+                'product_uom': line.product_uom.id,
+                'price_unit': line.cost,
+                'date_planned': date_planned,
+            }) for line in lines],
+        }
 
-        if not rfqs:
+    def _create_rfqs(self):
+        """Create one RFQ per requisition and vendor for all requisitions in
+        ``self`` with a single batched create, then move the requisitions
+        that got an RFQ to In Progress with a single write."""
+        date_planned = fields.Datetime.now()
+        po_vals_list = []
+        for requisition in self:
+            # Group lines by vendor
+            vendor_lines_map = {}
+            for line in requisition.line_ids:
+                if not line.vendor_id:
+                    continue
+                vendor_lines_map.setdefault(line.vendor_id.id, []).append(line)
+            po_vals_list += [
+                requisition._prepare_rfq_vals(vendor_id, lines, date_planned)
+                for vendor_id, lines in vendor_lines_map.items()
+            ]
+
+        if not po_vals_list:
             raise UserError(_("No valid lines with vendor found to create RFQ."))
 
+        rfqs = self.env['purchase.order'].create(po_vals_list)
+        rfqs.requisition_id.write({'state': 'in_progress'})
+        return rfqs
+
+    def _action_view_rfqs(self, rfqs):
         if len(rfqs) == 1:
-            self.write({'state': 'in_progress'})
             return {
                 'type': 'ir.actions.act_window',
                 'res_model': 'purchase.order',
                 'view_mode': 'form',
-                'res_id': rfqs[0].id,
+                'res_id': rfqs.id,
                 'target': 'current',
             }
-        else:
-            action = self.env['ir.actions.actions']._for_xml_id('purchase.purchase_rfq')
-            action['domain'] = [('id', 'in', [r.id for r in rfqs])]
-            return action
-
-    def action_material_arrived(self):
-        if not self.env.user.has_group('encode_material_requisition.group_mark_material_arrived'):
-            raise UserError("You are not authorized to mark materials as arrived.")
+        action = self.env['ir.actions.actions']._for_xml_id('purchase.purchase_rfq')
+        action['domain'] = [('id', 'in', rfqs.ids)]
+        return action
 
-        # Check that at least one line has a received quantity > 0
-        has_received = any(line.received_qty > 0 for line in self.line_ids)
-        if not has_received:
-            raise UserError(_("At least one line must have Received Qty > 0 before marking as received."))
+    def action_create_rfq(self):
+        rfqs = self._create_rfqs()
+        return self._action_view_rfqs(rfqs)
+
+    def action_generate_rfqs(self):
+        """List action: generate the RFQs of all selected approved
+        requisitions that have none yet, in one go."""
+        requisitions = self.filtered(lambda r: r.state == 'approved' and not r.rfq_created)
+        if not requisitions:
+            raise UserError(_("Select at least one approved requisition without RFQs."))
+        rfqs = requisitions._create_rfqs()
+        return requisitions._action_view_rfqs(rfqs)
 
-        self.write({
-            'state': 'material_arrived',
-            'material_arrived_date': fields.Datetime.now(),
-        })
+    def action_material_arrived(self):
+        self._apply_transition('material_arrived')
 
-    @api.depends('purchase_order_ids')
+    @api.depends('purchase_order_ids.date_order')
     def _compute_purchase_order_count(self):
+        # Recomputed by the ORM only for the requisitions whose RFQs were
+        # created, deleted or re-dated, with one grouped query per batch.
+        stats = {
+            requisition.id: (count, first_date, last_date)
+            for requisition, count, first_date, last_date in self.env['purchase.order']._read_group(
+                [('requisition_id', 'in', self._origin.ids)],
+                ['requisition_id'], ['__count', 'date_order:min', 'date_order:max'])
+        }
         for requisition in self:
-            requisition.purchase_order_count = len(requisition.purchase_order_ids)
-            requisition.rfq_created = bool(requisition.purchase_order_ids)
+            count, first_date, last_date = stats.get(requisition._origin.id, (0, False, False))
+            requisition.purchase_order_count = count
+            requisition.rfq_created = bool(count)
+            requisition.first_rfq_date = first_date
+            requisition.last_rfq_date = last_date
 
     def open_purchase_orders(self):
         """
@@ -153,60 +276,27 @@ class MaterialRequisition(models.Model):
             'target': 'current',
         }
 
-    def _send_notification_email(self):
-        """Send notification email to project manager when requisition is created"""
-        self.ensure_one()
-        
-        # Check if requisition is in draft or waiting state
-        if self.state not in ['draft', 'waiting']:
-            return
-        
-        # Check if project has a manager assigned
-        if not self.project_id.user_id:
-            self.message_post(
-                body=_("⚠️ Notification email not sent: No project manager assigned to this project."),
-                message_type='notification'
-            )
-            return
-        
-        # Check if project manager has an email
-        if not self.project_id.user_id.email:
-            self.message_post(
-                body=_("⚠️ Notification email not sent: Project manager does not have an email address."),
-                message_type='notification'
-            )
-            return
-        
-        try:
-            # Get the email template
-            template = self.env.ref('encode_material_requisition.email_template_material_requisition_notification_v2')
-            if not template:
-                self.message_post(
-                    body=_("⚠️ Notification email not sent: Email template not found."),
-                    message_type='notification'
-                )
-                return
-            
-            
-            # Send the email asynchronously with proper context
-            result = template.with_context(lang=self.project_id.user_id.lang or 'en_US').send_mail(
-                self.id, 
-                force_send=True
-            )
-            
-            
-            # Log success in chatter
-            self.message_post(
-                body=_("📧 Notification email sent to project manager: %s") % self.project_id.user_id.name,
-                message_type='notification'
-            )
-            
-        except Exception as e:
-            # Log error in chatter
-            self.message_post(
-                body=_("❌ Failed to send notification email: %s") % str(e),
-                message_type='notification'
-            )
+    def _queue_notifications(self):
+        """Queue the notification of new requisitions to their project manager.
+
+        Nothing is rendered or sent here: the entries are picked up by the
+        digest scheduled action, and the outcome is kept in the
+        notification log rather than posted in the chatter.
+        """
+        vals_list = []
+        for requisition in self:
+            # Only requisitions in draft or waiting state are notified
+            if requisition.state not in ['draft', 'waiting']:
+                continue
+            manager = requisition.project_id.user_id
+            vals = {'requisition_id': requisition.id, 'user_id': manager.id}
+            if not manager:
+                vals.update(state='skipped', reason=_("No project manager assigned to this project."))
+            elif not manager.email:
+                vals.update(state='skipped', reason=_("Project manager does not have an email address."))
+            vals_list.append(vals)
+        if vals_list:
+            self.env['material.requisition.notification'].sudo().create(vals_list)
 
 
 class MaterialRequisitionLine(models.Model):
@@ -238,7 +328,7 @@ class MaterialRequisitionLine(models.Model):
     vendor_id = fields.Many2one(
         'res.partner',
         string='Vendor',
-        domain="[('id', 'in', allowed_vendor_ids)]"
+        domain="[('id', 'in', allowed_vendor_ids)] if allowed_vendor_ids else [('supplier_rank', '>', 0)]"
     )
     allowed_vendor_ids = fields.Many2many(
         'res.partner',
@@ -256,13 +346,20 @@ class MaterialRequisitionLine(models.Model):
 
     @api.depends('product_id')
     def _compute_allowed_vendors(self):
-        Partner = self.env['res.partner']
+        # Resolve the sellers of all lines' products in one grouped query.
+        # Lines without sellers (or product) keep an empty list: vendor_id
+        # then falls back to an "any supplier" domain instead of carrying
+        # the id of every partner to the client.
+        templates = self.product_id.product_tmpl_id
+        vendors_per_template = {}
+        if templates:
+            for template, partner_ids in self.env['product.supplierinfo']._read_group(
+                    [('product_tmpl_id', 'in', templates.ids)],
+                    ['product_tmpl_id'], ['partner_id:array_agg']):
+                vendors_per_template[template.id] = partner_ids
         for line in self:
-            if line.product_id:
-                vendors = line.product_id.seller_ids.mapped('partner_id')
-                line.allowed_vendor_ids = vendors if vendors else Partner.search([])
-            else:
-                line.allowed_vendor_ids = Partner.search([])
+            vendor_ids = vendors_per_template.get(line.product_id.product_tmpl_id.id, [])
+            line.allowed_vendor_ids = [Command.set(vendor_ids)]
 
     @api.onchange('product_id')
     def _onchange_product_id_set_default_vendor(self):
@@ -283,11 +380,17 @@ class MaterialRequisitionLine(models.Model):
 
     @api.depends('requisition_id.work_type_id')
     def _compute_allowed_work_subtypes(self):
+        # Lines of a requisition share its work type: look up each distinct
+        # work type once, through the registry-level cache of work.sub.type.
+        WorkSubType = self.env['work.sub.type']
+        sub_types_per_work_type = {}
         for line in self:
-            if line.requisition_id and line.requisition_id.work_type_id:
-                line.allowed_work_sub_type_ids = self.env['work.sub.type'].search([
-                    ('work_type_id', '=', line.requisition_id.work_type_id.id)
-                ])
-            else:
-                line.allowed_work_sub_type_ids = self.env['work.sub.type'].browse()
+            work_type = line.requisition_id.work_type_id
+            if not work_type:
+                line.allowed_work_sub_type_ids = WorkSubType.browse()
+                continue
+            if work_type.id not in sub_types_per_work_type:
+                sub_types_per_work_type[work_type.id] = WorkSubType.browse(
+                    WorkSubType._get_sub_type_ids(work_type._origin.id))
+            line.allowed_work_sub_type_ids = sub_types_per_work_type[work_type.id]
 
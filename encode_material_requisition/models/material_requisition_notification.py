@@ -0,0 +1,65 @@
+import logging
+
+from odoo import models, fields, api, _
+
+_logger = logging.getLogger(__name__)
+
+
+class MaterialRequisitionNotification(models.Model):
+    """Queue and outcome log of the notifications sent to project managers
+    about new material requisitions. Pending entries are grouped per manager
+    into one digest email by a scheduled action."""
+    _name = 'material.requisition.notification'
+    _description = 'Material Requisition Notification'
+    _order = 'id desc'
+
+    requisition_id = fields.Many2one('material.requisition', required=True, index=True, ondelete='cascade')
+    user_id = fields.Many2one('res.users', string='Project Manager', index=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('queued', 'Queued'),
+        ('skipped', 'Skipped'),
+        ('failed', 'Failed'),
+    ], default='pending', required=True, index=True)
+    reason = fields.Char()
+    mail_id = fields.Many2one('mail.mail', string='Email', ondelete='set null')
+    queued_date = fields.Datetime(string='Queued On')
+
+    @api.model
+    def _cron_send_digests(self):
+        """Queue one digest email per project manager covering all of their
+        pending requisitions. The emails go through the regular mail queue,
+        so nothing here waits on the mail server."""
+        pending = self.search([('state', '=', 'pending')])
+        entries_per_user = {}
+        for entry in pending:
+            entries_per_user.setdefault(entry.user_id, self.browse())
+            entries_per_user[entry.user_id] |= entry
+
+        for user, entries in entries_per_user.items():
+            try:
+                with self.env.cr.savepoint():
+                    mail = self._create_digest_mail(user, entries.requisition_id)
+            except Exception as e:
+                _logger.exception("Material requisition digest for user %s failed", user.id)
+                entries.write({'state': 'failed', 'reason': str(e)})
+                continue
+            entries.write({
+                'state': 'queued',
+                'mail_id': mail.id,
+                'queued_date': fields.Datetime.now(),
+            })
+
+    @api.model
+    def _create_digest_mail(self, user, requisitions):
+        body = self.env['ir.qweb'].with_context(lang=user.lang or 'en_US')._render(
+            'encode_material_requisition.material_requisition_digest',
+            {'user': user, 'requisitions': requisitions},
+        )
+        return self.env['mail.mail'].sudo().create({
+            'subject': _("طلبات مواد جديدة (%s)") % len(requisitions),
+            'body_html': body,
+            'email_from': self.env.company.email_formatted or self.env.user.email_formatted,
+            'recipient_ids': [(4, user.partner_id.id)],
+            'auto_delete': True,
+        })
@@ -0,0 +1,123 @@
+from odoo import models, fields, api, tools
+
+# Requisition states whose RFQs are reported on the dashboards
+ROLLUP_STATES = ('approved', 'in_progress', 'material_arrived')
+
+
+class MaterialRequisitionRfqRollup(models.Model):
+    """Monthly RFQ counts per project (and its company), keyed on the month of
+    the requisition date. Buckets are refreshed incrementally at the end of
+    each transaction touching requisitions or their RFQs, so reports read a
+    handful of rows regardless of how much history is kept."""
+    _name = 'material.requisition.rfq.rollup'
+    _description = 'Material Requisition RFQ Monthly Rollup'
+    _order = 'month, project_id'
+
+    month = fields.Date(required=True, readonly=True)
+    project_id = fields.Many2one('project.project', required=True, readonly=True, ondelete='cascade')
+    company_id = fields.Many2one('res.company', readonly=True, ondelete='cascade')
+    rfq_count = fields.Integer(readonly=True)
+
+    _sql_constraints = [
+        ('month_project_uniq', 'unique (month, project_id)', 'Only one rollup row per project and month.'),
+    ]
+
+    def init(self):
+        tools.create_index(self._cr, 'material_requisition_rfq_rollup_company_month_index',
+                           self._table, ['company_id', 'month'])
+
+    @api.model
+    def _mark_requisitions(self, requisitions):
+        """Schedule a refresh of the buckets ``requisitions`` currently fall in.
+        Called before and after a change so that both the old and the new
+        buckets are refreshed at commit time."""
+        keys = {
+            (requisition.date.date().replace(day=1), requisition.project_id.id)
+            for requisition in requisitions
+            if requisition.id and requisition.date and requisition.project_id
+        }
+        if not keys:
+            return
+        data = self.env.cr.precommit.data
+        key = 'encode_material_requisition.rfq_rollup_keys'
+        if key not in data:
+            data[key] = set()
+            env = self.env
+
+            @self.env.cr.precommit.add
+            def refresh_rfq_rollup():
+                env['material.requisition.rfq.rollup'].sudo()._refresh(data.pop(key, set()))
+        data[key].update(keys)
+
+    @api.model
+    def _refresh(self, keys=None):
+        """Recompute the given (month, project_id) buckets, or all of them."""
+        self.env['material.requisition'].flush_model(['date', 'project_id', 'state', 'purchase_order_count'])
+        self.env['project.project'].flush_model(['company_id'])
+        params = {'states': ROLLUP_STATES, 'uid': self.env.uid}
+        if keys is None:
+            self.env.cr.execute('DELETE FROM material_requisition_rfq_rollup')
+            bucket_filter = 'TRUE'
+        elif not keys:
+            return
+        else:
+            months, project_ids = zip(*keys)
+            params.update(months=list(months), project_ids=list(project_ids))
+            self.env.cr.execute('''
+                DELETE FROM material_requisition_rfq_rollup r
+                USING unnest(%(months)s::date[], %(project_ids)s::int[]) AS k(month, project_id)
+                WHERE r.month = k.month AND r.project_id = k.project_id
+            ''', params)
+            bucket_filter = '''
+                (DATE_TRUNC('month', mr.date)::date, mr.project_id) IN (
+                    SELECT * FROM unnest(%(months)s::date[], %(project_ids)s::int[])
+                )'''
+        self.env.cr.execute('''
+            INSERT INTO material_requisition_rfq_rollup
+                (month, project_id, company_id, rfq_count, create_uid, create_date, write_uid, write_date)
+            SELECT DATE_TRUNC('month', mr.date)::date, mr.project_id, pp.company_id, SUM(mr.purchase_order_count),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+            FROM material_requisition mr
+            JOIN project_project pp ON pp.id = mr.project_id
+            WHERE mr.state IN %(states)s
+              AND mr.date IS NOT NULL
+              AND mr.purchase_order_count > 0
+              AND {bucket_filter}
+            GROUP BY DATE_TRUNC('month', mr.date), mr.project_id, pp.company_id
+        '''.format(bucket_filter=bucket_filter), params)
+        self.invalidate_model()
+
+    @api.model
+    def _rebuild(self):
+        self._refresh()
+
+    @api.model
+    def _get_cumulative_series(self, date_from=None, date_to=None, project_ids=None, company_ids=None):
+        """Return ``[(month, cumulative_count)]`` for the months in range. The
+        running total includes the RFQs of the months before ``date_from``."""
+        where = ['TRUE']
+        params = {}
+        if project_ids:
+            where.append('project_id = ANY(%(project_ids)s)')
+            params['project_ids'] = list(project_ids)
+        if company_ids is not None:
+            where.append('(company_id IS NULL OR company_id = ANY(%(company_ids)s))')
+            params['company_ids'] = list(company_ids)
+        if date_to:
+            where.append('month <= %(date_to)s')
+            params['date_to'] = fields.Date.to_date(date_to)
+        outer = 'TRUE'
+        if date_from:
+            outer = 'month >= %(date_from)s'
+            params['date_from'] = fields.Date.start_of(fields.Date.to_date(date_from), 'month')
+        self.env.cr.execute('''
+            SELECT month, cumulative FROM (
+                SELECT month, SUM(SUM(rfq_count)) OVER (ORDER BY month) AS cumulative
+                FROM material_requisition_rfq_rollup
+                WHERE {where}
+                GROUP BY month
+            ) series
+            WHERE {outer}
+            ORDER BY month
+        '''.format(where=' AND '.join(where), outer=outer), params)
+        return [(month, int(cumulative)) for month, cumulative in self.env.cr.fetchall()]
@@ -1,6 +1,26 @@
-from odoo import models, fields
+from odoo import models, fields, api
 
 class PurchaseOrder(models.Model):
     _inherit = 'purchase.order'
 
-    requisition_id = fields.Many2one('material.requisition', string='Material Requisition', ondelete='cascade') 
\ No newline at end of file
+    requisition_id = fields.Many2one('material.requisition', string='Material Requisition', ondelete='cascade',
+                                     index=True)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        orders = super().create(vals_list)
+        self.env['material.requisition.rfq.rollup']._mark_requisitions(orders.requisition_id)
+        return orders
+
+    def write(self, vals):
+        rollup = self.env['material.requisition.rfq.rollup']
+        if 'requisition_id' in vals:
+            rollup._mark_requisitions(self.requisition_id)
+        res = super().write(vals)
+        if 'requisition_id' in vals:
+            rollup._mark_requisitions(self.requisition_id)
+        return res
+
+    def unlink(self):
+        self.env['material.requisition.rfq.rollup']._mark_requisitions(self.requisition_id)
+        return super().unlink()
@@ -1,4 +1,4 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from random import randint
 
 
@@ -48,3 +48,27 @@ class WorkSubType(models.Model):
     color = fields.Integer(string='Color', default=_get_default_color, aggregator=False)
     description = fields.Text(string='Description')
     work_type_id = fields.Many2one('work.type', string='Work Type')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'work_type_id' in vals:
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @tools.ormcache('work_type_id')
+    def _get_sub_type_ids(self, work_type_id):
+        """Ids of the sub types of a work type, cached per registry and
+        invalidated whenever a sub type is created, written or deleted."""
+        return tuple(self.sudo().search([('work_type_id', '=', work_type_id)]).ids)
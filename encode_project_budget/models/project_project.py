@@ -2,6 +2,9 @@ from odoo import models, fields, _
 from odoo.exceptions import UserError
 import re
 
+ARABIC_CHARS_RE = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
+
+
 class ProjectProject(models.Model):
     _inherit = "project.project"
 
@@ -19,26 +22,42 @@ class ProjectProject(models.Model):
     )
 
     def _compute_budget_exists(self):
+        # One grouped query for the whole recordset instead of a count per project
         BudgetLine = self.env['budget.line'].sudo()
+        account_ids = self.account_id.ids
+        project_ids, line_account_ids = set(), set()
+        if account_ids:
+            groups = BudgetLine._read_group(
+                ['|', ('account_id', 'in', account_ids), ('project_id', 'in', self._origin.ids)],
+                ['project_id', 'account_id'], ['__count'],
+            )
+            for project, account, _count in groups:
+                project_ids.add(project.id)
+                line_account_ids.add(account.id)
         for project in self:
             if project.account_id:
-                project.budget_exists = bool(
-                    BudgetLine.search_count([
-                        '|',
-                        ('account_id', '=', project.account_id.id),
-                        ('project_id', '=', project.id),
-                    ])
+                project.budget_exists = (
+                    project._origin.id in project_ids or project.account_id.id in line_account_ids
                 )
             else:
                 project.budget_exists = False
 
     def _compute_budget_stats(self):
+        # Budgets are linked either directly or through one of their lines;
+        # collect the budget ids of both paths per project and count them once.
         Budget = self.env['budget.analytic'].sudo()
+        BudgetLine = self.env['budget.line'].sudo()
+        origin_ids = self._origin.ids
+        budget_ids_per_project = {project_id: set() for project_id in origin_ids}
+        for project, budget_ids in Budget._read_group(
+                [('project_id', 'in', origin_ids)], ['project_id'], ['id:array_agg']):
+            budget_ids_per_project[project.id].update(budget_ids)
+        for project, budget_ids in BudgetLine._read_group(
+                [('project_id', 'in', origin_ids), ('budget_analytic_id', '!=', False)],
+                ['project_id'], ['budget_analytic_id:array_agg']):
+            budget_ids_per_project[project.id].update(budget_ids)
         for project in self:
-            domain = ['|', ('project_id', '=', project.id), ('budget_line_ids.project_id', '=', project.id)]
-            cnt = Budget.search_count(domain)
-            project.budget_count = cnt
-            project.budget_exists = bool(cnt)
+            project.budget_count = len(budget_ids_per_project.get(project._origin.id, ()))
 
 
     def action_open_budgets(self):
@@ -62,47 +81,48 @@ class ProjectProject(models.Model):
             },
         }
 
-    def action_create_budget(self):
+    def _prepare_budget_vals(self):
         self.ensure_one()
-
-        if hasattr(self, 'budget_exists') and self.budget_exists:
-            raise UserError(_("A budget already exists for this project"))
-
-        Budget = self.env['budget.analytic'].sudo()
-        BudgetLine = self.env['budget.line'].sudo()
-
-        # All fields are Date, so use them directly
-        date_from = self.date_start
-        date_to = self.date
-
-        # Optional sanity check
-        if date_from and date_to and date_to < date_from:
-            raise UserError(_("Project end date cannot be before start date."))
-
-        is_ar = bool(re.search(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]', self.name or ''))
+        is_ar = bool(ARABIC_CHARS_RE.search(self.name or ''))
         label = (_("ميزانية %s") % self.name) if is_ar else (_("Budget %s") % self.name)
 
         budget_vals = {
             'state': 'draft',
             'name': label,
             'budget_type': 'expense',
-            'date_from': date_from,  # project.date_start
-            'date_to': date_to,  # project.date
+            'date_from': self.date_start,  # project.date_start
+            'date_to': self.date,  # project.date
         }
-        if 'project_id' in Budget._fields:
+        if 'project_id' in self.env['budget.analytic']._fields:
             budget_vals['project_id'] = self.id
+        return budget_vals
+
+    def _create_budgets(self):
+        """Create one draft budget with a single budget line per project in
+        ``self``, using one batched create for the budgets and one for the
+        lines. Returns the created budgets, in the order of ``self``."""
+        # All fields are Date, so compare them directly
+        invalid = self.filtered(lambda p: p.date_start and p.date and p.date < p.date_start)
+        if invalid:
+            raise UserError(_("Project end date cannot be before start date: %s")
+                            % ", ".join(invalid.mapped('display_name')))
+
+        budgets = self.env['budget.analytic'].sudo().create(
+            [project._prepare_budget_vals() for project in self])
+        self.env['budget.line'].sudo().create([{
+            'budget_analytic_id': budget.id,
+            'account_id': project.account_id.id if project.account_id else False,
+            'project_id': project.id,
+        } for project, budget in zip(self, budgets)])
+        return budgets
 
-        budget = Budget.create(budget_vals)
-
+    def action_create_budget(self):
+        self.ensure_one()
 
+        if hasattr(self, 'budget_exists') and self.budget_exists:
+            raise UserError(_("A budget already exists for this project"))
 
-        # Create a related budget.line
-        line_vals = {
-            'budget_analytic_id': budget.id,
-            'account_id': self.account_id.id if self.account_id else False,
-            'project_id': self.id,
-        }
-        BudgetLine.create(line_vals)
+        budget = self._create_budgets()
 
         # Redirect to the new Budget form
         return {
@@ -113,3 +133,22 @@ class ProjectProject(models.Model):
             'res_id': budget.id,
             'target': 'current',
         }
+
+    def action_create_budgets(self):
+        """Bulk variant of :meth:`action_create_budget` for the project list,
+        e.g. when opening a new fiscal year. Projects that already have a
+        budget are skipped."""
+        # budget_exists / budget_count are computed for the whole recordset at once
+        projects = self.filtered(lambda p: not p.budget_exists and not p.budget_count)
+        if not projects:
+            raise UserError(_("All selected projects already have a budget."))
+
+        budgets = projects._create_budgets()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Budgets'),
+            'res_model': 'budget.analytic',
+            'view_mode': 'list,form',
+            'domain': [('id', 'in', budgets.ids)],
+            'target': 'current',
+        }
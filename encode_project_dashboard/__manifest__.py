@@ -20,6 +20,7 @@
         'project',
         'hr_timesheet',
         'web',
+        'bus',
         'encode_project_budget',
     ],
     'data': [
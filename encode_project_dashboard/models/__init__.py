@@ -1 +1,5 @@
 from . import project
+from . import project_task
+from . import account_analytic_line
+from . import budget_line
+from . import ir_websocket
@@ -0,0 +1,26 @@
+from odoo import models, api, tools
+
+
+class AccountAnalyticLine(models.Model):
+    _inherit = 'account.analytic.line'
+
+    def init(self):
+        super().init()
+        # write_date watermark of project.project's get_dashboard_changes
+        tools.create_index(self._cr, 'account_analytic_line_write_date_index', self._table, ['write_date'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        lines.project_id._notify_dashboard_changes()
+        return lines
+
+    def write(self, vals):
+        projects = self.project_id
+        res = super().write(vals)
+        (projects | self.project_id)._notify_dashboard_changes()
+        return res
+
+    def unlink(self):
+        self.project_id._notify_dashboard_changes()
+        return super().unlink()
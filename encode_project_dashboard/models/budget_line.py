@@ -0,0 +1,36 @@
+from odoo import models, api, tools
+
+
+class BudgetLine(models.Model):
+    _inherit = 'budget.line'
+
+    def init(self):
+        super().init()
+        # write_date watermark of project.project's get_dashboard_changes
+        tools.create_index(self._cr, 'budget_line_write_date_index', self._table, ['write_date'])
+
+    def _get_dashboard_projects(self):
+        """Projects whose dashboard figures include these lines, either
+        through the line's project or through the project's analytic account."""
+        projects = self.project_id
+        if self.account_id:
+            projects |= self.env['project.project'].sudo().search([
+                ('account_id', 'in', self.account_id.ids),
+            ])
+        return projects
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        lines._get_dashboard_projects()._notify_dashboard_changes()
+        return lines
+
+    def write(self, vals):
+        projects = self._get_dashboard_projects()
+        res = super().write(vals)
+        (projects | self._get_dashboard_projects())._notify_dashboard_changes()
+        return res
+
+    def unlink(self):
+        self._get_dashboard_projects()._notify_dashboard_changes()
+        return super().unlink()
@@ -0,0 +1,75 @@
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+_logger = logging.getLogger(__name__)
+
+PARAM_DEBUG = 'encode_project_dashboard.debug'
+PARAM_SAMPLE_RATE = 'encode_project_dashboard.sample_rate'
+
+
+class DashboardProbe:
+    """Per-phase timers and counters for one dashboard load.
+
+    A probe is created once per dashboard payload and shared by
+    every project processed in it. It only emits a single summary log line,
+    and only when the load is sampled (``encode_project_dashboard.sample_rate``)
+    or when ``encode_project_dashboard.debug`` is set, in which case a
+    per-project breakdown is logged at DEBUG level as well.
+    """
+
+    def __init__(self, debug=False, sample_rate=0.0):
+        self.debug = debug
+        self.sampled = debug or (sample_rate > 0 and random.random() < sample_rate)
+        self.timers = defaultdict(float)
+        self.counters = defaultdict(int)
+        self._started = time.perf_counter()
+
+    @classmethod
+    def from_env(cls, env):
+        """Build a probe configured from the system parameters."""
+        ICP = env['ir.config_parameter'].sudo()
+        debug = ICP.get_param(PARAM_DEBUG, 'False').lower() in ('1', 'true', 'yes')
+        try:
+            sample_rate = float(ICP.get_param(PARAM_SAMPLE_RATE, '0') or 0)
+        except ValueError:
+            sample_rate = 0.0
+        return cls(debug=debug, sample_rate=min(max(sample_rate, 0.0), 1.0))
+
+    @contextmanager
+    def phase(self, name):
+        """Accumulate the wall time spent inside the block under ``name``."""
+        if not self.sampled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+
+    def count(self, name, value=1):
+        if self.sampled:
+            self.counters[name] += value
+
+    def trace(self, project, result):
+        """Log a per-project breakdown when the debug flag is on."""
+        if self.debug:
+            _logger.debug(
+                "project dashboard: project=%s tasks=%s hours=%.2f budget_lines=%s",
+                project.id, result['total_tasks'], result['total_time_spent'],
+                len(result['budget_lines']))
+
+    def flush(self):
+        """Emit the one structured summary line for this load."""
+        if not self.sampled:
+            return
+        total = time.perf_counter() - self._started
+        _logger.info(
+            "project dashboard load: total=%.1fms phases={%s} counters={%s}",
+            total * 1000,
+            ', '.join('%s: %.1fms' % (k, v * 1000) for k, v in sorted(self.timers.items())),
+            ', '.join('%s: %d' % (k, v) for k, v in sorted(self.counters.items())),
+        )
@@ -0,0 +1,13 @@
+from odoo import models
+
+from .project import DASHBOARD_BUS_CHANNEL
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = 'ir.websocket'
+
+    def _build_bus_channel_list(self, channels):
+        # Dashboard change notifications are for internal users only
+        if DASHBOARD_BUS_CHANNEL in channels and not (self.env.user and self.env.user._is_internal()):
+            channels = [channel for channel in channels if channel != DASHBOARD_BUS_CHANNEL]
+        return super()._build_bus_channel_list(channels)
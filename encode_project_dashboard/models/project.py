@@ -1,16 +1,101 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import UserError
 import logging
+import threading
+import time
+from datetime import timedelta
+
+from .dashboard_probe import DashboardProbe
 
 _logger = logging.getLogger(__name__)
 
+# Candidate field names on budget.line, in order of preference
+BUDGET_ACHIEVED_FIELDS = ('amount_achieved', 'achieved_amount', 'actual_amount', 'achieved', 'amount_actual')
+BUDGET_BUDGETED_FIELDS = ('budget_amount', 'budgeted', 'planned_amount', 'amount_budgeted')
+
+# Delta sync of the polling loop, see get_dashboard_changes
+SYNC_TOKEN_VERSION = '1'
+SYNC_OVERLAP = timedelta(seconds=30)
+SYNC_FULL_INTERVAL = timedelta(minutes=5)
+
+# Live updates pushed on the bus, see _notify_dashboard_changes
+DASHBOARD_BUS_CHANNEL = 'encode_project_dashboard'
+DASHBOARD_BUS_NOTIFICATION = 'encode_project_dashboard/changes'
+DASHBOARD_BUS_MIN_INTERVAL = 2.0  # seconds between two notifications per database and worker
+_bus_lock = threading.Lock()
+_bus_last_sent = {}  # dbname -> monotonic time of the last notification
+_bus_pending = {}  # dbname -> project ids held back by the rate limit
+
 
 class Project(models.Model):
     _inherit = 'project.project'
 
-    def get_dashboard_data(self):
+    @api.model
+    @tools.ormcache()
+    def _get_budget_field_map(self):
+        """Resolve which ``budget.line`` fields hold the achieved and budgeted
+        amounts. Cached per registry, so the probing happens once instead of
+        once per line."""
+        BudgetLine = self.env['budget.line']
+        achieved = next((f for f in BUDGET_ACHIEVED_FIELDS if f in BudgetLine._fields), None)
+        budgeted = next((f for f in BUDGET_BUDGETED_FIELDS if f in BudgetLine._fields), None)
+        return achieved, budgeted
+
+    def _get_dashboard_budget_lines(self, probe):
+        """Fetch the budget figures of all projects in ``self`` with a single
+        search and a single batched read.
+
+        :return: dict mapping project id to a list of
+                 ``{'achieved_amount': float, 'budgeted': float}``
+        """
+        result = {project.id: [] for project in self}
+        account_ids = self.account_id.ids
+        domain = [('project_id', 'in', self.ids)]
+        if account_ids:
+            domain = ['|'] + domain + [('account_id', 'in', account_ids)]
+        achieved_field, budgeted_field = self._get_budget_field_map()
+        read_fields = ['project_id', 'account_id'] + [
+            f for f in (achieved_field, budgeted_field) if f]
+
+        with probe.phase('budget_fetch'):
+            lines = self.env['budget.line'].search(domain)
+            rows = lines.read(read_fields, load=None)
+        probe.count('budget_lines', len(rows))
+
+        projects_by_account = {}
+        for project in self:
+            if project.account_id:
+                projects_by_account.setdefault(project.account_id.id, []).append(project.id)
+
+        for row in rows:
+            values = {
+                'achieved_amount': (row[achieved_field] or 0) if achieved_field else 0,
+                'budgeted': (row[budgeted_field] or 0) if budgeted_field else 0,
+            }
+            project_ids = set(projects_by_account.get(row['account_id'], []))
+            if row['project_id'] in result:
+                project_ids.add(row['project_id'])
+            for project_id in project_ids:
+                result[project_id].append(values)
+        return result
+
+    def _get_dashboard_time_spent(self, tasks, probe):
+        """Hours logged on ``tasks``, read from the daily timesheet rollup
+        of project_dashboard_odoo when it is installed."""
+        if 'project.timesheet.rollup' in self.env:
+            [(hours,)] = self.env['project.timesheet.rollup']._read_group(
+                [('task_id', 'in', tasks.ids)], [], ['unit_amount:sum'])
+            return hours or 0
+        timesheets = tasks.timesheet_ids
+        probe.count('timesheets', len(timesheets))
+        return sum(timesheets.mapped('unit_amount'))
+
+    def get_dashboard_data(self, probe=None, budget_lines=None):
         """Get raw project data for JavaScript processing"""
         self.ensure_one()
+        standalone = probe is None
+        if standalone:
+            probe = DashboardProbe.from_env(self.env)
         
         try:
             # Use Odoo's built-in task count fields
@@ -19,90 +104,17 @@ class Project(models.Model):
             open_tasks = self.open_task_count or 0
             
             # Get all tasks for timesheet calculation
-            all_tasks = self.env['project.task'].search([('project_id', '=', self.id)])
+            with probe.phase('task_scan'):
+                all_tasks = self.env['project.task'].search([('project_id', '=', self.id)])
+            probe.count('tasks', len(all_tasks))
             
             # Calculate total time spent from timesheets on all project tasks
-            total_time_spent = 0
-            for task in all_tasks:
-                task_timesheets = task.timesheet_ids
-                task_time = sum(task_timesheets.mapped('unit_amount'))
-                total_time_spent += task_time
+            with probe.phase('timesheet_sum'):
+                total_time_spent = self._get_dashboard_time_spent(all_tasks, probe)
             
             # Get budget data
-            budget_lines = self.env['budget.line'].search([
-                '|',
-                ('project_id', '=', self.id),
-                ('account_id', '=', self.account_id.id) if self.account_id else (False, '=', False)
-            ])
-            
-            # Debug: Print all available fields in budget.line model
-            if budget_lines:
-                sample_line = budget_lines[0]
-                _logger.info(f"=== BUDGET.LINE MODEL FIELDS ===")
-                _logger.info(f"All fields: {list(sample_line._fields.keys())}")
-                _logger.info(f"Sample line: {sample_line}")
-                _logger.info(f"Sample line ID: {sample_line.id}")
-                _logger.info(f"=== END BUDGET.LINE MODEL FIELDS ===")
-            
-            _logger.info(f"Budget lines found for project {self.name}: {len(budget_lines)}")
-            for line in budget_lines:
-                _logger.info(f"Budget line: {line.name if hasattr(line, 'name') else 'No name'}, "
-                           f"achieved: {getattr(line, 'achieved', 'N/A')}, "
-                           f"budgeted: {getattr(line, 'budgeted', 'N/A')}, "
-                           f"budget_amount: {getattr(line, 'budget_amount', 'N/A')}")
-                
-                # Log all available fields for debugging
-                _logger.info(f"Budget line fields: {list(line._fields.keys())}")
-                
-                # Try to access the line directly to see what's available
-                _logger.info(f"Budget line record: {line}")
-                _logger.info(f"Budget line ID: {line.id}")
-                
-                # Try to get the actual values using different methods
-                try:
-                    achieved_val = line.achieved if hasattr(line, 'achieved') else 'No achieved field'
-                    budgeted_val = line.budgeted if hasattr(line, 'budgeted') else 'No budgeted field'
-                    budget_amount_val = line.budget_amount if hasattr(line, 'budget_amount') else 'No budget_amount field'
-                    
-                    _logger.info(f"Direct access - achieved: {achieved_val}, budgeted: {budgeted_val}, budget_amount: {budget_amount_val}")
-                except Exception as e:
-                    _logger.error(f"Error accessing budget line fields: {e}")
-            
-            # Also get budget analytics data
-            budget_analytics = self.env['budget.analytic'].search([
-                '|',
-                ('project_id', '=', self.id),
-                ('budget_line_ids.project_id', '=', self.id)
-            ])
-            
-            _logger.info(f"Budget analytics found for project {self.name}: {len(budget_analytics)}")
-            
-            # Try different field names for budget data
-            budget_data = []
-            for line in budget_lines:
-                # Try multiple possible field names for achieved amount
-                achieved = (getattr(line, 'amount_achieved', 0) or 
-                           getattr(line, 'achieved_amount', 0) or 
-                           getattr(line, 'actual_amount', 0) or 
-                           getattr(line, 'achieved', 0) or 
-                           getattr(line, 'amount_actual', 0) or 0)
-                
-                budgeted = (getattr(line, 'budget_amount', 0) or 
-                           getattr(line, 'budgeted', 0) or 
-                           getattr(line, 'planned_amount', 0) or 
-                           getattr(line, 'amount_budgeted', 0) or 0)
-                
-                budget_data.append({
-                    'achieved_amount': achieved,
-                    'budgeted': budgeted
-                })
-                
-                _logger.info(f"Processed budget line - achieved: {achieved}, budgeted: {budgeted}")
-                _logger.info(f"Tried fields - amount_achieved: {getattr(line, 'amount_achieved', 'N/A')}, "
-                           f"achieved_amount: {getattr(line, 'achieved_amount', 'N/A')}, "
-                           f"actual_amount: {getattr(line, 'actual_amount', 'N/A')}, "
-                           f"achieved: {getattr(line, 'achieved', 'N/A')}, "
-                           f"amount_actual: {getattr(line, 'amount_actual', 'N/A')}")
+            if budget_lines is None:
+                budget_lines = self._get_dashboard_budget_lines(probe).get(self.id, [])
             
             # Convert allocated time from days to hours (assuming 8 hours per day)
             # Get working hours from company settings or default to 8
@@ -118,10 +130,12 @@ class Project(models.Model):
                 'closed_tasks': closed_tasks,
                 'open_tasks': open_tasks,
                 'total_time_spent': total_time_spent,
-                'budget_lines': budget_data
+                'budget_lines': budget_lines
             }
-            
-            _logger.info(f"Final result for project {self.name}: {result}")
+            probe.count('projects')
+            probe.trace(self, result)
+            if standalone:
+                probe.flush()
             
             return result
             
@@ -138,6 +152,23 @@ class Project(models.Model):
                 'budget_lines': []
             }
 
+    def _get_dashboard_payload(self):
+        """Build the dashboard data of every project in ``self``."""
+        probe = DashboardProbe.from_env(self.env)
+        budget_map = self._get_dashboard_budget_lines(probe)
+        dashboard_data = []
+        for project in self:
+            try:
+                data = project.get_dashboard_data(
+                    probe=probe, budget_lines=budget_map.get(project.id, []))
+                dashboard_data.append(data)
+            except Exception as e:
+                _logger.error(f"Error processing project {project.name}: {str(e)}")
+                continue
+        
+        probe.flush()
+        return dashboard_data
+
     @api.model
     def get_all_dashboard_data(self):
         """Get raw data for all active projects"""
@@ -147,17 +178,140 @@ class Project(models.Model):
             if not projects:
                 return []
             
-            dashboard_data = []
-            for project in projects:
-                try:
-                    data = project.get_dashboard_data()
-                    dashboard_data.append(data)
-                except Exception as e:
-                    _logger.error(f"Error processing project {project.name}: {str(e)}")
-                    continue
-            
-            return dashboard_data
+            return projects._get_dashboard_payload()
             
         except Exception as e:
             _logger.error(f"Error in get_all_dashboard_data: {str(e)}")
             return []
+
+    @api.model
+    def _parse_sync_token(self, sync_token):
+        """Return ``(watermark, full_sync_at)`` from a token issued by
+        :meth:`get_dashboard_changes`, or ``None`` if it is missing, malformed
+        or issued by another version of the protocol."""
+        try:
+            version, watermark, full_sync_at = (sync_token or '').split('|')
+            if version != SYNC_TOKEN_VERSION:
+                return None
+            watermark = fields.Datetime.to_datetime(watermark)
+            full_sync_at = fields.Datetime.to_datetime(full_sync_at)
+            if not watermark or not full_sync_at:
+                return None
+            return watermark, full_sync_at
+        except ValueError:
+            return None
+
+    @api.model
+    def _get_changed_dashboard_project_ids(self, since):
+        """Ids of the projects whose own record, tasks, timesheets or budget
+        lines were written after ``since``."""
+        self.env.flush_all()
+        self.env.cr.execute("""
+            SELECT id FROM project_project WHERE write_date > %(since)s
+            UNION
+            SELECT project_id FROM project_task
+             WHERE write_date > %(since)s AND project_id IS NOT NULL
+            UNION
+            SELECT project_id FROM account_analytic_line
+             WHERE write_date > %(since)s AND project_id IS NOT NULL
+            UNION
+            SELECT project_id FROM budget_line
+             WHERE write_date > %(since)s AND project_id IS NOT NULL
+            UNION
+            SELECT pp.id FROM budget_line bl
+              JOIN project_project pp ON pp.account_id = bl.account_id
+             WHERE bl.write_date > %(since)s
+        """, {'since': since})
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def get_dashboard_changes(self, sync_token=None):
+        """Delta variant of :meth:`get_all_dashboard_data` for the polling loop.
+
+        The client sends back the ``token`` of its previous response. Only the
+        projects whose tasks, timesheets or budget lines changed since then
+        (by ``write_date``) are returned; an unchanged poll only returns a new
+        token. A full payload is sent when no valid token is given and every
+        ``SYNC_FULL_INTERVAL`` so that deletions, which leave no
+        ``write_date`` behind, are eventually picked up.
+
+        :return: ``{'token': str, 'full': bool, 'changed': bool,
+                  'projects': [...], 'removed_ids': [...]}`` where
+                 ``projects`` and ``removed_ids`` are only present when
+                 ``changed`` is set
+        """
+        now = self.env.cr.now()
+        parsed = self._parse_sync_token(sync_token)
+        if not parsed or now - parsed[1] > SYNC_FULL_INTERVAL:
+            token = '|'.join((SYNC_TOKEN_VERSION, fields.Datetime.to_string(now),
+                              fields.Datetime.to_string(now)))
+            return {
+                'token': token,
+                'full': True,
+                'changed': True,
+                'projects': self.get_all_dashboard_data(),
+                'removed_ids': [],
+            }
+
+        watermark, full_sync_at = parsed
+        token = '|'.join((SYNC_TOKEN_VERSION, fields.Datetime.to_string(now),
+                          fields.Datetime.to_string(full_sync_at)))
+        # write_date is the start time of the writing transaction, so re-scan
+        # a short overlap to catch transactions that committed after the
+        # previous poll read its watermark.
+        changed_ids = self._get_changed_dashboard_project_ids(watermark - SYNC_OVERLAP)
+        if not changed_ids:
+            return {'token': token, 'full': False, 'changed': False}
+
+        changed = self.with_context(active_test=False).search([('id', 'in', changed_ids)])
+        active = changed.filtered('active')
+        return {
+            'token': token,
+            'full': False,
+            'changed': True,
+            'projects': active._get_dashboard_payload(),
+            'removed_ids': (changed - active).ids,
+        }
+
+    def write(self, vals):
+        res = super().write(vals)
+        self._notify_dashboard_changes()
+        return res
+
+    def _notify_dashboard_changes(self):
+        """Announce on the bus that the dashboard figures of ``self`` changed.
+
+        Calls are coalesced per transaction: the project ids are collected and
+        a single notification is sent right before commit. Notifications are
+        also rate-limited per worker; ids held back by the limit are sent with
+        the next notification, and clients keep a slow delta poll as a safety
+        net in case no further change comes.
+        """
+        project_ids = [pid for pid in self._origin.ids if pid]
+        if not project_ids:
+            return
+        data = self.env.cr.precommit.data
+        key = 'encode_project_dashboard.changed_project_ids'
+        if key not in data:
+            data[key] = set()
+            env = self.env
+
+            @self.env.cr.precommit.add
+            def send_dashboard_changes():
+                env['project.project']._send_dashboard_changes(data.pop(key, set()))
+        data[key].update(project_ids)
+
+    @api.model
+    def _send_dashboard_changes(self, project_ids):
+        dbname = self.env.cr.dbname
+        now = time.monotonic()
+        with _bus_lock:
+            if now - _bus_last_sent.get(dbname, 0) < DASHBOARD_BUS_MIN_INTERVAL:
+                _bus_pending.setdefault(dbname, set()).update(project_ids)
+                return
+            project_ids = set(project_ids) | _bus_pending.pop(dbname, set())
+            _bus_last_sent[dbname] = now
+        if project_ids:
+            self.env['bus.bus']._sendone(DASHBOARD_BUS_CHANNEL, DASHBOARD_BUS_NOTIFICATION, {
+                'project_ids': sorted(project_ids),
+            })
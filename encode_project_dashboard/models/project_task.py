@@ -0,0 +1,27 @@
+from odoo import models, api, tools
+
+
+class ProjectTask(models.Model):
+    _inherit = 'project.task'
+
+    def init(self):
+        super().init()
+        # write_date watermark of project.project's get_dashboard_changes
+        tools.create_index(self._cr, 'project_task_write_date_index', self._table, ['write_date'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tasks = super().create(vals_list)
+        tasks.project_id._notify_dashboard_changes()
+        return tasks
+
+    def write(self, vals):
+        # Both the previous and the new project are affected by a move
+        projects = self.project_id
+        res = super().write(vals)
+        (projects | self.project_id)._notify_dashboard_changes()
+        return res
+
+    def unlink(self):
+        self.project_id._notify_dashboard_changes()
+        return super().unlink()
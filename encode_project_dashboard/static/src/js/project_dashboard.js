@@ -6,6 +6,12 @@ import { registry } from "@web/core/registry";
 
 console.log("🔧 Loading Project Dashboard module...");
 
+// Must match DASHBOARD_BUS_CHANNEL / DASHBOARD_BUS_NOTIFICATION in models/project.py
+const DASHBOARD_BUS_CHANNEL = "encode_project_dashboard";
+const DASHBOARD_BUS_NOTIFICATION = "encode_project_dashboard/changes";
+const CHANGES_DEBOUNCE_DELAY = 1000; // 1 second
+const FALLBACK_POLL_INTERVAL = 120000; // 2 minutes
+
 class ProjectDashboard extends Component {
 
     /**
@@ -15,6 +21,8 @@ class ProjectDashboard extends Component {
 		super.setup();
         console.log("🔧 Setting up ProjectDashboard component...");
 		this.orm = useService("orm");
+		this.busService = useService("bus_service");
+		this.onDashboardChanges = this.onDashboardChanges.bind(this);
 
 		this.state = useState({
             projects: [],
@@ -46,7 +54,9 @@ class ProjectDashboard extends Component {
             // not used
             //            this.startLiveAnimations();
 
-            // Update data every 30 seconds without page refresh
+            // Live updates pushed on the bus, with a slow delta poll as fallback
+            this.busService.addChannel(DASHBOARD_BUS_CHANNEL);
+            this.busService.subscribe(DASHBOARD_BUS_NOTIFICATION, this.onDashboardChanges);
             this.startDataUpdates();
         });
 
@@ -55,6 +65,9 @@ class ProjectDashboard extends Component {
             if (this.updateInterval) {
                 clearInterval(this.updateInterval);
             }
+            clearTimeout(this.changesTimeout);
+            this.busService.unsubscribe(DASHBOARD_BUS_NOTIFICATION, this.onDashboardChanges);
+            this.busService.deleteChannel(DASHBOARD_BUS_CHANNEL);
         });
     }
     //  End setup
@@ -77,11 +90,14 @@ class ProjectDashboard extends Component {
         console.log("🔧 Loading dashboard data...");
         try {
             this.state.loading = true;
-            const rawData = await this.orm.call(
+            const response = await this.orm.call(
                 "project.project",
-                "get_all_dashboard_data",
-                []
+                "get_dashboard_changes",
+                [null]
             );
+            // Token sent back by the polling loop to only receive changed projects
+            this.syncToken = response.token;
+            const rawData = response.projects;
 
             // Process raw data and calculate metrics , return to (state > projects)
             this.state.projects = rawData.map(project => {
@@ -514,23 +530,37 @@ class ProjectDashboard extends Component {
 
 
     startDataUpdates() {
-        // Update data and trigger synchronized animations every 10 seconds
-        this.updateInterval = setInterval(async () => {
-            await this.updateDashboardData();
+        // Changes are pushed on the bus; this slow delta poll only catches
+        // notifications that were rate-limited or missed while offline
+        this.updateInterval = setInterval(() => this.refreshChangedProjects(), FALLBACK_POLL_INTERVAL);
+    }
+    // Bus handler: coalesce bursts of notifications into one delta fetch
+    onDashboardChanges(payload) {
+        clearTimeout(this.changesTimeout);
+        this.changesTimeout = setTimeout(() => this.refreshChangedProjects(), CHANGES_DEBOUNCE_DELAY);
+    }
+    async refreshChangedProjects() {
+        // Fetch only the projects changed since our sync token and animate their cards
+        const changed = await this.updateDashboardData();
+        if (changed) {
             this.applyFilters();
-        }, 10000); // 10 seconds
+        }
     }
     async updateDashboardData() {
         try {
             console.log("🔧 Updating dashboard data...");
-            const rawData = await this.orm.call(
+            const response = await this.orm.call(
                 "project.project",
-                "get_all_dashboard_data",
-                []
+                "get_dashboard_changes",
+                [this.syncToken || null]
             );
+            this.syncToken = response.token;
+            if (!response.changed) {
+                return false;
+            }
 
             // Calculate new metrics
-            const updatedProjects = rawData.map(project => this.calculateProjectMetrics(project));
+            const updatedProjects = this.mergeProjectChanges(response);
 
             // Animate transitions from current values to new values
             await this.animateDataTransition(updatedProjects);
@@ -542,9 +572,30 @@ class ProjectDashboard extends Component {
 
 
             console.log("🔧 Dashboard data updated successfully");
+            return true;
         } catch (error) {
             console.error("Error updating dashboard data:", error);
+            return false;
+        }
+    }
+    // Apply a get_dashboard_changes response to the current project list,
+    // keeping the existing order so the transitions animate the right cards
+    mergeProjectChanges(response) {
+        const incoming = response.projects.map(project => this.calculateProjectMetrics(project));
+        if (response.full) {
+            return incoming;
         }
+        const incomingById = new Map(incoming.map(project => [project.id, project]));
+        const removedIds = new Set(response.removed_ids);
+        const merged = this.state.projects
+            .filter(project => !removedIds.has(project.id))
+            .map(project => {
+                const updated = incomingById.get(project.id);
+                incomingById.delete(project.id);
+                return updated || project;
+            });
+        // Projects created since the last sync
+        return merged.concat([...incomingById.values()]);
     }
 
     // removed : not used
@@ -31,9 +31,14 @@
     'company': 'Cybrosys Techno Solutions',
     'maintainer': 'Cybrosys Techno Solutions',
     'website': 'https://www.cybrosys.com',
-    'depends': ['sale_management', 'project', 'purchase', 'sale_timesheet', 'encode_re_development',
+    'depends': ['sale_management', 'project', 'purchase', 'sale_timesheet', 'bus', 'encode_re_development',
                 'encode_material_requisition'],
-    'data': ['views/dashboard_views.xml'],
+    'data': ['security/ir.model.access.csv',
+             'security/project_dashboard_security.xml',
+             'data/timesheet_rollup_data.xml',
+             'data/ir_cron_data.xml',
+             'views/dashboard_views.xml',
+             'views/project_dashboard_call_views.xml'],
     'assets': {
         'web.assets_backend': [
             'project_dashboard_odoo/static/src/js/dashboard.js',
@@ -21,10 +21,14 @@
 ###############################################################################
 from datetime import date, datetime
 
-from odoo import http
+from odoo import http, _
+from odoo.exceptions import UserError
 from odoo.http import request
 from odoo import fields
 
+# Most employees returned by the timesheet graph
+TOP_EMPLOYEES_MAX_LIMIT = 100
+
 
 class ProjectFilter(http.Controller):
     """The ProjectFilter class provides the filter option to the js.
@@ -61,20 +65,56 @@ class ProjectFilter(http.Controller):
         }
 
 
-    @http.route('/employee/timesheet', auth='public', type='json')
-    def get_top_timesheet_employees(self):
+    @http.route('/employee/timesheet', auth='user', type='json')
+    def get_top_timesheet_employees(self, date_from=None, date_to=None, company_ids=None, limit=10):
         """Summary:
             when the page is loaded, get the data for the timesheet graph.
+        Args:
+            date_from: optional first day ('YYYY-MM-DD') of the timesheets
+            date_to: optional last day ('YYYY-MM-DD') of the timesheets
+            company_ids: optional list of company ids, restricted to the
+                user's allowed companies; defaults to the active companies
+            limit: number of employees to return, at most
+                TOP_EMPLOYEES_MAX_LIMIT
         Return:
             type:It is a list. This list contains data that affects the graph
             of employees."""
-        query = '''select hr_employee.name as employee,sum(unit_amount) as unit
-                    from account_analytic_line
-                    inner join hr_employee on hr_employee.id =
-                    account_analytic_line.employee_id
-                    group by hr_employee.id 
-                    ORDER BY unit DESC Limit 10 '''
-        request._cr.execute(query)
+        if company_ids:
+            company_ids = [cid for cid in company_ids if cid in request.env.user.company_ids.ids]
+        else:
+            company_ids = request.env.companies.ids
+
+        # The hours are summed from the daily timesheet rollup; ORDER BY +
+        # LIMIT lets PostgreSQL keep a top-N heap instead of sorting all
+        # employees. Names are only joined for the returned rows.
+        where = ['tr.employee_id IS NOT NULL', 'tr.company_id = ANY(%(company_ids)s)']
+        try:
+            limit = min(max(int(limit), 1), TOP_EMPLOYEES_MAX_LIMIT)
+            date_from = fields.Date.to_date(date_from) if date_from else None
+            date_to = fields.Date.to_date(date_to) if date_to else None
+        except (TypeError, ValueError):
+            raise UserError(_("Invalid limit or date range."))
+        params = {'company_ids': company_ids, 'limit': limit}
+        if date_from:
+            where.append('tr.date >= %(date_from)s')
+            params['date_from'] = date_from
+        if date_to:
+            where.append('tr.date <= %(date_to)s')
+            params['date_to'] = date_to
+        query = '''
+            SELECT hr_employee.name AS employee, top.unit AS unit
+            FROM (
+                SELECT tr.employee_id, SUM(tr.unit_amount) AS unit
+                FROM project_timesheet_rollup tr
+                WHERE {where}
+                GROUP BY tr.employee_id
+                ORDER BY unit DESC
+                LIMIT %(limit)s
+            ) top
+            JOIN hr_employee ON hr_employee.id = top.employee_id
+            ORDER BY top.unit DESC
+        '''.format(where=' AND '.join(where))
+        request._cr.execute(query, params)
         top_product = request._cr.dictfetchall()
         unit = [record.get('unit') for record in top_product]
         employee = [record.get('employee') for record in top_product]
@@ -84,32 +124,23 @@ class ProjectFilter(http.Controller):
     @http.route('/project/count', auth='public', type='json')
     def get_project_count(self):
         """Returns the count of projects per status for the donut chart."""
-        status_keys = ['new', 'in_progress', 'completed', 'on_hold', 'cancelled']
-        status_labels = ['New', 'In Progress', 'Completed', 'On Hold', 'Cancelled']
-        colors = ['#1E90FF', '#FFA500', '#32CD32', '#808080', '#FF0000']
-        # colors = ['blue', 'orange', 'green', 'gray', 'red']
-
-        result = {key: 0 for key in status_keys}
-
-        if request.env.user.has_group('project.group_project_manager'):
-            projects = request.env['project.project'].search([])
-        else:
-            projects = request.env['project.project'].search([('user_id', '=', request.env.uid)])
-
-        for project in projects:
-            if project.status in result:
-                result[project.status] += 1
-
+        status_list = request.env['project.project'].get_dashboard_distribution()['status_list']
         return {
-            'labels': status_labels,
-            'data': [result[status] for status in status_keys],
-            'colors': colors,
+            'labels': [status['name'] for status in status_list],
+            'data': [status['projects'] for status in status_list],
+            'colors': [status['color'] for status in status_list],
+            'status_list': status_list,
         }
 
     @http.route('/dashboard/material_requisition_data', type='json', auth='user')
-    def material_requisition_data(self):
+    def material_requisition_data(self, date_from=None, date_to=None, company_ids=None):
         """
         Returns stacked bar chart data of material requisitions by state, grouped by project.
+
+        :param date_from: optional lower bound (inclusive, 'YYYY-MM-DD') on the MR date
+        :param date_to: optional upper bound (inclusive, 'YYYY-MM-DD') on the MR date
+        :param company_ids: optional list of company ids, restricted to the
+            user's allowed companies; defaults to the active companies
         """
 
         # Use 'state' values from your model
@@ -122,54 +153,66 @@ class ProjectFilter(http.Controller):
             ('cancelled', 'Cancelled', '#f44336'),
         ]
 
-        # Query MRs grouped by project and state
+        if company_ids:
+            company_ids = [cid for cid in company_ids if cid in request.env.user.company_ids.ids]
+        else:
+            company_ids = request.env.companies.ids
+
+        # Aggregate on (project_id, state), served by the
+        # material_requisition_project_state_index, then resolve the
+        # translated project names in SQL for the user's language.
+        where = ['(pp.company_id IS NULL OR pp.company_id = ANY(%(company_ids)s))']
+        params = {
+            'company_ids': company_ids,
+            'lang': request.env.lang or 'en_US',
+        }
+        if date_from:
+            where.append('mr.date >= %(date_from)s')
+            params['date_from'] = fields.Date.to_date(date_from)
+        if date_to:
+            where.append("mr.date < %(date_to)s + INTERVAL '1 day'")
+            params['date_to'] = fields.Date.to_date(date_to)
         query = '''
-            SELECT pp.name AS project, mr.state AS state, COUNT(*) AS count
-            FROM material_requisition mr
-            LEFT JOIN project_project pp ON pp.id = mr.project_id
-            GROUP BY pp.name, mr.state
-        '''
-        request._cr.execute(query)
+            SELECT agg.project_id AS project_id,
+                   COALESCE(pp.name->>%(lang)s, pp.name->>'en_US') AS project,
+                   agg.state AS state,
+                   agg.count AS count
+            FROM (
+                SELECT mr.project_id, mr.state, COUNT(*) AS count
+                FROM material_requisition mr
+                LEFT JOIN project_project pp ON pp.id = mr.project_id
+                WHERE {where}
+                GROUP BY mr.project_id, mr.state
+            ) agg
+            LEFT JOIN project_project pp ON pp.id = agg.project_id
+            ORDER BY project, agg.project_id
+        '''.format(where=' AND '.join(where))
+        request._cr.execute(query, params)
         rows = request._cr.dictfetchall()
 
-
-        user_lang = request.env.user.lang or 'en_US'
-
         # Organize into project → state → count
         project_data = {}
+        project_names = {}
         for row in rows:
-            project_trans = row['project']
-
-            if isinstance(project_trans, dict):
-                # Try user's language → fallback to en_US → fallback to any available translation
-                proj = (
-                        project_trans.get(user_lang) or
-                        project_trans.get('en_US') or
-                        next(iter(project_trans.values()))
-                )
-            else:
-                proj = project_trans or 'Unassigned'
+            project_id = row['project_id']
+            if project_id not in project_data:
+                project_data[project_id] = {s[0]: 0 for s in states}
+                project_names[project_id] = row['project'] or 'Unassigned'
+            project_data[project_id][row['state']] = row['count']
 
-
-            state = row['state']
-            count = row['count']
-
-            if proj not in project_data:
-                project_data[proj] = {s[0]: 0 for s in states}
-            project_data[proj][state] = count
-
-        labels = list(project_data.keys())
+        project_ids = list(project_data.keys())
         datasets = []
 
         for state_code, state_label, color in states:
             datasets.append({
                 'label': state_label,
-                'data': [project_data[proj][state_code] for proj in labels],
+                'data': [project_data[pid][state_code] for pid in project_ids],
                 'backgroundColor': color
             })
 
         return {
-            'labels': labels,
+            'labels': [project_names[pid] for pid in project_ids],
+            'project_ids': project_ids,
             'datasets': datasets
         }
 
@@ -209,38 +252,31 @@ class ProjectFilter(http.Controller):
 
 
     @http.route('/dashboard/rfq_cumulative_data', type='json', auth='user')
-    def rfq_cumulative_data(self):
+    def rfq_cumulative_data(self, date_from=None, date_to=None, project_ids=None, company_ids=None):
         """
         Returns cumulative RFQ data over time (monthly) from approved MRs.
+
+        Read from the monthly RFQ rollup, so the cost does not grow with the
+        requisition history.
+
+        :param date_from: optional first month to return ('YYYY-MM-DD'); the
+            cumulative total still includes the earlier months
+        :param date_to: optional last month to return ('YYYY-MM-DD')
+        :param project_ids: optional list of project ids to restrict to
+        :param company_ids: optional list of company ids, restricted to the
+            user's allowed companies; defaults to the active companies
         """
-        query = '''
-                SELECT
-                    TRIM(TO_CHAR(DATE_TRUNC('month', mr.date), 'Month')) || '-' || TO_CHAR(DATE_TRUNC('month', mr.date), 'YYYY') AS month,
-                    COUNT(po.id) AS rfq_count
-                FROM
-                    material_requisition mr
-                JOIN
-                    purchase_order po ON po.requisition_id = mr.id
-                WHERE
-                    mr.state IN ('approved', 'in_progress', 'material_arrived')
-                    AND mr.date IS NOT NULL
-                GROUP BY DATE_TRUNC('month', mr.date)
-                ORDER BY DATE_TRUNC('month', mr.date)
-            '''
-        request._cr.execute(query)
-        rows = request._cr.dictfetchall()
+        if company_ids:
+            company_ids = [cid for cid in company_ids if cid in request.env.user.company_ids.ids]
+        else:
+            company_ids = request.env.companies.ids
 
-        cumulative = 0
-        labels = []
-        data = []
-        for row in rows:
-            cumulative += row['rfq_count']
-            labels.append(row['month'])  # Already formatted as 'YYYY-MM'
-            data.append(cumulative)
+        series = request.env['material.requisition.rfq.rollup'].sudo()._get_cumulative_series(
+            date_from=date_from, date_to=date_to, project_ids=project_ids, company_ids=company_ids)
 
         return {
-            'labels': labels,
-            'data': data,
+            'labels': [month.strftime('%B-%Y') for month, _cumulative in series],
+            'data': [cumulative for _month, cumulative in series],
             'color': '#4caf50'  # Green for approved RFQs
         }
 
@@ -322,18 +358,16 @@ class ProjectFilter(http.Controller):
                                 request.env['project.project'].search([])]
             else:
                 pro_selected = [int(data['project'])]
-        report_project = request.env['timesheets.analysis.report'].search(
+        analytic_project = request.env['account.analytic.line'].search(
             [('project_id', 'in', pro_selected),
              ('employee_id', 'in', emp_selected)])
-        analytic_project = request.env['account.analytic.line'].search(
+        margin = request.env['project.margin.summary']._get_margin(
+            [('project_id', 'in', pro_selected),
+             ('employee_id', 'in', emp_selected)])
+        sale_orders = analytic_project.order_id.ids
+        total_time = self._get_timesheet_hours(
             [('project_id', 'in', pro_selected),
              ('employee_id', 'in', emp_selected)])
-        margin = round(sum(report_project.mapped('margin')), 2)
-        sale_orders = []
-        for rec in analytic_project:
-            if rec.order_id.id and rec.order_id.id not in sale_orders:
-                sale_orders.append(rec.order_id.id)
-        total_time = sum(analytic_project.mapped('unit_amount'))
         return {
             'total_project': pro_selected,
             'total_emp': emp_selected,
@@ -345,6 +379,12 @@ class ProjectFilter(http.Controller):
             'total_so': sale_orders
         }
 
+    def _get_timesheet_hours(self, domain):
+        """Sum the hours of the daily timesheet rollup matching ``domain``."""
+        [(hours,)] = request.env['project.timesheet.rollup']._read_group(
+            domain, [], ['unit_amount:sum'])
+        return hours or 0
+
     @http.route('/get/tiles/data', auth='public', type='json')
     def get_tiles_data(self):
         """Summary:
@@ -357,11 +397,8 @@ class ProjectFilter(http.Controller):
         if request.env.user.has_group('project.group_project_manager'):
             all_project = request.env['project.project'].search([])
             all_task = request.env['project.task'].search([])
-            analytic_project = request.env['account.analytic.line'].search([])
-            report_project = request.env['timesheets.analysis.report'].search(
-                [])
-            margin = round(sum(report_project.mapped('margin')), 2)
-            total_time = sum(analytic_project.mapped('unit_amount'))
+            margin = request.env['project.margin.summary']._get_margin([])
+            total_time = self._get_timesheet_hours([])
             employees = request.env['hr.employee'].search([])
             task = request.env['project.task'].sudo().search_read([
                 ('sale_order_id', '!=', False)
@@ -370,35 +407,9 @@ class ProjectFilter(http.Controller):
             task_so_ids = list(set(task_so_ids))
             sale_orders = request.env['sale.order'].browse(task_so_ids)
 
-            # ############ standard project stage
-            project_stage_ids = request.env['project.project.stage'].search([])
-            project_stage_list = []
-            for project_stage_id in project_stage_ids:
-                total_projects = request.env[
-                    'project.project'].sudo().search_count(
-                    [('stage_id', '=', project_stage_id.id)])
-                project_stage_list.append({'name': project_stage_id.name,
-                                           'projects': total_projects})
-            # ################### for custom status #############3
-            project_status_list = []
-
-            status_options = {
-                'new': 'New',
-                'in_progress': 'In Progress',
-                'completed': 'Completed',
-                'on_hold': 'On Hold',
-                'cancelled': 'Cancelled',
-            }
-
-            for status_code, status_label in status_options.items():
-                total_projects = request.env['project.project'].sudo().search_count([
-                    ('status', '=', status_code)
-                ])
-                project_status_list.append({
-                    'name': status_label,
-                    'projects': total_projects
-                })
-
+            distribution = request.env['project.project'].get_dashboard_distribution()
+            project_stage_list = distribution['stage_list']
+            project_status_list = distribution['status_list']
 
             return {
                 'total_projects': len(all_project),
@@ -421,9 +432,8 @@ class ProjectFilter(http.Controller):
                 for assignee in task.user_ids:
                     if assignee.id == request.env.uid:
                         all_task.append(task.id)
-            analytic_project = request.env['account.analytic.line'].search(
+            total_time = self._get_timesheet_hours(
                 [('project_id', 'in', all_project.ids)])
-            total_time = sum(analytic_project.mapped('unit_amount'))
             task = request.env['project.task'].sudo().search_read([
                 ('sale_order_id', '!=', False),
                 ('project_id', 'in', all_project.ids)
@@ -431,16 +441,7 @@ class ProjectFilter(http.Controller):
             task_so_ids = [o['sale_order_id'][0] for o in task]
             sale_orders = request.mapped('sale_line_id.order_id') | request.env[
                 'sale.order'].browse(task_so_ids)
-            project_stage_ids = request.env['project.project.stage'].search([])
-            project_stage_list = []
-            for project_stage_id in project_stage_ids:
-                total_projects = request.env['project.project'].search_count(
-                    [('stage_id', '=', project_stage_id.id),
-                     ('id', 'in', all_project.ids)])
-                project_stage_list.append({
-                    'name': project_stage_id.name,
-                    'projects': total_projects
-                })
+            distribution = request.env['project.project'].get_dashboard_distribution()
             return {
                 'total_projects': len(all_project),
                 'total_projects_ids': all_project.ids,
@@ -449,7 +450,8 @@ class ProjectFilter(http.Controller):
                 'total_hours': total_time,
                 'total_sale_orders': len(sale_orders),
                 'sale_orders_ids': sale_orders.mapped('id'),
-                'project_stage_list': project_stage_list,
+                'project_stage_list': distribution['stage_list'],
+                'project_status_list': distribution['status_list'],
                 'flag': 2}
 
     @http.route('/get/hours', auth='public', type='json')
@@ -460,82 +462,26 @@ class ProjectFilter(http.Controller):
             type:It is a dictionary variable. This dictionary contains data that
             hours table."""
         if request.env.user.has_group('project.group_project_manager'):
-            query = '''SELECT sum(unit_amount) as hour_recorded FROM 
-            account_analytic_line WHERE 
-            timesheet_invoice_type='non_billable_project' '''
-            request._cr.execute(query)
-            data = request._cr.dictfetchall()
-            hour_recorded = []
-            for record in data:
-                hour_recorded.append(record.get('hour_recorded'))
-            query = '''SELECT sum(unit_amount) as hour_recorde FROM 
-            account_analytic_line WHERE 
-            timesheet_invoice_type='billable_time' '''
-            request._cr.execute(query)
-            data = request._cr.dictfetchall()
-            hour_recorde = []
-            for record in data:
-                hour_recorde.append(record.get('hour_recorde'))
-            query = '''SELECT sum(unit_amount) as billable_fix FROM 
-            account_analytic_line WHERE 
-            timesheet_invoice_type='billable_fixed' '''
-            request._cr.execute(query)
-            data = request._cr.dictfetchall()
-            billable_fix = []
-            for record in data:
-                billable_fix.append(record.get('billable_fix'))
-            query = '''SELECT sum(unit_amount) as non_billable FROM 
-            account_analytic_line WHERE timesheet_invoice_type='non_billable' 
-            '''
-            request._cr.execute(query)
-            data = request._cr.dictfetchall()
-            non_billable = []
-            for record in data:
-                non_billable.append(record.get('non_billable'))
-            query = '''SELECT sum(unit_amount) as total_hr FROM 
-            account_analytic_line WHERE 
-            timesheet_invoice_type='non_billable_project' or
-            timesheet_invoice_type='billable_time' or 
-            timesheet_invoice_type='billable_fixed' or 
-            timesheet_invoice_type='non_billable' '''
-            request._cr.execute(query)
-            data = request._cr.dictfetchall()
-            total_hr = []
-            for record in data:
-                total_hr.append(record.get('total_hr'))
-            return {
-                'hour_recorded': hour_recorded,
-                'hour_recorde': hour_recorde,
-                'billable_fix': billable_fix,
-                'non_billable': non_billable,
-                'total_hr': total_hr,
-            }
+            domain = []
         else:
             all_project = request.env['project.project'].search(
                 [('user_id', '=', request.env.uid)]).ids
-            analytic_project = request.env['account.analytic.line'].search(
-                [('project_id', 'in', all_project)])
-            all_hour_recorded = analytic_project.filtered(
-                lambda x: x.timesheet_invoice_type == 'non_billable_project')
-            all_hour_recorde = analytic_project.filtered(
-                lambda x: x.timesheet_invoice_type == 'billable_time')
-            all_billable_fix = analytic_project.filtered(
-                lambda x: x.timesheet_invoice_type == 'billable_fixed')
-            all_non_billable = analytic_project.filtered(
-                lambda x: x.timesheet_invoice_type == 'non_billable')
-            hour_recorded = [sum(all_hour_recorded.mapped('unit_amount'))]
-            hour_recorde = [sum(all_hour_recorde.mapped('unit_amount'))]
-            billable_fix = [sum(all_billable_fix.mapped('unit_amount'))]
-            non_billable = [sum(all_non_billable.mapped('unit_amount'))]
-            total_hr = [
-                sum(hour_recorded + hour_recorde + billable_fix + non_billable)]
-            return {
-                'hour_recorded': hour_recorded,
-                'hour_recorde': hour_recorde,
-                'billable_fix': billable_fix,
-                'non_billable': non_billable,
-                'total_hr': total_hr,
-            }
+            domain = [('project_id', 'in', all_project)]
+        hours = dict(request.env['project.timesheet.rollup']._read_group(
+            domain, ['timesheet_invoice_type'], ['unit_amount:sum']))
+        hour_recorded = [hours.get('non_billable_project', 0)]
+        hour_recorde = [hours.get('billable_time', 0)]
+        billable_fix = [hours.get('billable_fixed', 0)]
+        non_billable = [hours.get('non_billable', 0)]
+        total_hr = [
+            sum(hour_recorded + hour_recorde + billable_fix + non_billable)]
+        return {
+            'hour_recorded': hour_recorded,
+            'hour_recorde': hour_recorde,
+            'billable_fix': billable_fix,
+            'non_billable': non_billable,
+            'total_hr': total_hr,
+        }
 
     @http.route('/get/task/data', auth='public', type='json')
     def get_task_data(self):
@@ -20,3 +20,9 @@
 #
 ###############################################################################
 from . import project_project
+from . import account_analytic_line
+from . import project_timesheet_rollup
+from . import project_margin_summary
+from . import project_dashboard_call
+from . import project_dashboard_profile_rule
+from . import ir_http
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from odoo import api, models
+
+# Fields of the timesheet lines that the daily rollup depends on
+ROLLUP_FIELDS = {'date', 'employee_id', 'project_id', 'task_id', 'unit_amount',
+                 'company_id', 'timesheet_invoice_type'}
+
+
+class AccountAnalyticLine(models.Model):
+    """This class inherits from 'account.analytic.line' to keep the daily
+    timesheet rollup of the dashboard up to date."""
+    _inherit = 'account.analytic.line'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env['project.timesheet.rollup']._mark_timesheets(lines)
+        return lines
+
+    def write(self, vals):
+        if not ROLLUP_FIELDS & vals.keys():
+            return super().write(vals)
+        rollup = self.env['project.timesheet.rollup']
+        if {'date', 'employee_id', 'project_id'} & vals.keys():
+            rollup._mark_timesheets(self)
+        res = super().write(vals)
+        rollup._mark_timesheets(self)
+        return res
+
+    def unlink(self):
+        self.env['project.timesheet.rollup']._mark_timesheets(self)
+        return super().unlink()
+
+    def _compute_project_id(self):
+        # Stored computes are flushed without going through write()
+        super()._compute_project_id()
+        self.env['project.timesheet.rollup']._mark_timesheets(self)
+
+    def _compute_timesheet_invoice_type(self):
+        super()._compute_timesheet_invoice_type()
+        self.env['project.timesheet.rollup']._mark_timesheets(self)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+import inspect
+import json
+import logging
+import threading
+import time
+
+from odoo import fields, models
+from odoo.http import request
+from odoo.tools.profiler import Profiler
+
+from ..controllers.project_dashboard_odoo import ProjectFilter
+from .project_dashboard_call import record_call
+
+_logger = logging.getLogger(__name__)
+
+# Routes of the dashboard controller, plus the project dashboard
+# (encode_project_dashboard) methods called through call_kw
+INSTRUMENTED_PATHS = frozenset(
+    route
+    for _name, method in inspect.getmembers(ProjectFilter, callable)
+    for route in getattr(method, 'original_routing', {}).get('routes', [])
+) | frozenset({
+    '/web/dataset/call_kw/project.project/get_all_dashboard_data',
+    '/web/dataset/call_kw/project.project/get_dashboard_changes',
+})
+
+
+class IrHttp(models.AbstractModel):
+    """Record the query count, SQL and Python time, payload size and user
+    scope of every dashboard call while instrumentation is enabled, and
+    profile the routes with an active profiling rule. Other routes only pay
+    for a set lookup and a cached rule lookup."""
+    _inherit = 'ir.http'
+
+    @classmethod
+    def _dispatch(cls, endpoint):
+        path = request.httprequest.path
+        rule = request.env['project.dashboard.profile.rule']._match(path, request.env.uid)
+        if not rule:
+            return cls._dispatch_instrumented(endpoint)
+
+        rule_id, threshold_ms = rule
+        started = time.perf_counter()
+        with Profiler(collectors=['sql', 'traces_async'], db=None, description=path) as profiler:
+            result = cls._dispatch_instrumented(endpoint)
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms > threshold_ms:
+            try:
+                request.env['project.dashboard.profile.rule']._store_profile(
+                    rule_id, path, request.env.uid, duration_ms, profiler)
+            except Exception:
+                _logger.exception("Could not store the profile of %s", path)
+        return result
+
+    @classmethod
+    def _dispatch_instrumented(cls, endpoint):
+        if request.httprequest.path not in INSTRUMENTED_PATHS \
+                or not request.env['project.dashboard.call']._is_instrumentation_enabled():
+            return super(IrHttp, cls)._dispatch(endpoint)
+
+        thread = threading.current_thread()
+        query_count = getattr(thread, 'query_count', 0)
+        query_time = getattr(thread, 'query_time', 0.0)
+        started = time.perf_counter()
+        result = super(IrHttp, cls)._dispatch(endpoint)
+        duration = time.perf_counter() - started
+        sql_time = getattr(thread, 'query_time', 0.0) - query_time
+
+        try:
+            payload_bytes = len(json.dumps(result, default=str))
+        except (TypeError, ValueError):
+            payload_bytes = 0
+        record_call(request.env.registry, {
+            'endpoint': request.httprequest.path,
+            'call_date': fields.Datetime.now(),
+            'user_id': request.env.uid,
+            'company_ids': ','.join(str(cid) for cid in request.env.companies.ids),
+            'query_count': getattr(thread, 'query_count', 0) - query_count,
+            'sql_ms': sql_time * 1000,
+            'python_ms': (duration - sql_time) * 1000,
+            'duration_ms': duration * 1000,
+            'payload_bytes': payload_bytes,
+        })
+        return result
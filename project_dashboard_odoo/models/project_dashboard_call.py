@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+import atexit
+import logging
+import threading
+from datetime import timedelta
+
+from odoo import SUPERUSER_ID, api, fields, models, tools
+
+_logger = logging.getLogger(__name__)
+
+PARAM_ENABLED = 'project_dashboard_odoo.instrumentation'
+PARAM_RETENTION_DAYS = 'project_dashboard_odoo.instrumentation_retention_days'
+# Calls kept in memory per database before they are written
+BUFFER_SIZE = 1000
+# Seconds a call stays at most in a worker's buffer
+FLUSH_INTERVAL = 60
+
+_buffer_lock = threading.Lock()
+_buffers = {}
+_registries = {}
+_flush_timers = {}
+
+
+def record_call(registry, vals):
+    """Buffer one call of the database. The buffered calls of this worker are
+    written in a separate transaction as soon as BUFFER_SIZE calls are
+    buffered, FLUSH_INTERVAL seconds after the first buffered call, and when
+    the worker process exits."""
+    dbname = registry.db_name
+    with _buffer_lock:
+        _registries[dbname] = registry
+        buffer = _buffers.setdefault(dbname, [])
+        buffer.append(vals)
+        full = len(buffer) >= BUFFER_SIZE
+        if not full and dbname not in _flush_timers:
+            timer = threading.Timer(FLUSH_INTERVAL, flush_calls, (registry,))
+            timer.daemon = True
+            _flush_timers[dbname] = timer
+            timer.start()
+    if full:
+        flush_calls(registry)
+
+
+def flush_calls(registry):
+    """Write the calls buffered by this worker for the database of
+    ``registry``."""
+    with _buffer_lock:
+        vals_list = _buffers.pop(registry.db_name, [])
+        timer = _flush_timers.pop(registry.db_name, None)
+    if timer:
+        timer.cancel()
+    if not vals_list:
+        return
+    try:
+        with registry.cursor() as cr:
+            api.Environment(cr, SUPERUSER_ID, {})['project.dashboard.call'].create(vals_list)
+    except Exception:
+        _logger.exception("Could not flush %s dashboard call records", len(vals_list))
+
+
+@atexit.register
+def _flush_all_calls():
+    # Workers recycled on limit_request or memory limits exit normally
+    for registry in list(_registries.values()):
+        flush_calls(registry)
+
+
+class ProjectDashboardCall(models.Model):
+    """One instrumented call of a dashboard endpoint. Calls are only
+    recorded while the project_dashboard_odoo.instrumentation system
+    parameter is set, see ir.http."""
+    _name = 'project.dashboard.call'
+    _description = 'Dashboard Endpoint Call'
+    _order = 'call_date desc'
+    _log_access = False
+
+    endpoint = fields.Char(required=True, index=True, readonly=True)
+    call_date = fields.Datetime(required=True, index=True, readonly=True)
+    user_id = fields.Many2one('res.users', readonly=True, ondelete='cascade')
+    company_ids = fields.Char(string='Companies', readonly=True)
+    query_count = fields.Integer(string='Queries', readonly=True)
+    sql_ms = fields.Float(string='SQL Time (ms)', readonly=True)
+    python_ms = fields.Float(string='Python Time (ms)', readonly=True)
+    duration_ms = fields.Float(string='Duration (ms)', readonly=True)
+    payload_bytes = fields.Integer(string='Payload Size (bytes)', readonly=True)
+
+    @api.model
+    def _is_instrumentation_enabled(self):
+        # get_param is cached, this costs no query per call
+        ICP = self.env['ir.config_parameter'].sudo()
+        return ICP.get_param(PARAM_ENABLED, 'False').lower() in ('1', 'true', 'yes')
+
+    @api.autovacuum
+    def _gc_dashboard_calls(self):
+        days = int(self.env['ir.config_parameter'].sudo().get_param(PARAM_RETENTION_DAYS, 30) or 30)
+        self.search([('call_date', '<', fields.Datetime.now() - timedelta(days=days))]).unlink()
+
+
+class ProjectDashboardCallReport(models.Model):
+    """Latency and query count percentiles per endpoint."""
+    _name = 'project.dashboard.call.report'
+    _description = 'Dashboard Endpoint Statistics'
+    _auto = False
+    _order = 'p95_ms desc'
+
+    endpoint = fields.Char(readonly=True)
+    call_count = fields.Integer(string='Calls', readonly=True)
+    p50_ms = fields.Float(string='p50 (ms)', readonly=True)
+    p95_ms = fields.Float(string='p95 (ms)', readonly=True)
+    p50_queries = fields.Float(string='p50 Queries', readonly=True)
+    p95_queries = fields.Float(string='p95 Queries', readonly=True)
+    avg_sql_ms = fields.Float(string='Avg SQL Time (ms)', readonly=True)
+    avg_python_ms = fields.Float(string='Avg Python Time (ms)', readonly=True)
+    avg_payload_bytes = fields.Float(string='Avg Payload Size (bytes)', readonly=True)
+    last_call_date = fields.Datetime(string='Last Call', readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW project_dashboard_call_report AS (
+                SELECT MIN(id) AS id,
+                       endpoint,
+                       COUNT(*) AS call_count,
+                       PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY duration_ms) AS p50_ms,
+                       PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY duration_ms) AS p95_ms,
+                       PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY query_count) AS p50_queries,
+                       PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY query_count) AS p95_queries,
+                       AVG(sql_ms) AS avg_sql_ms,
+                       AVG(python_ms) AS avg_python_ms,
+                       AVG(payload_bytes) AS avg_payload_bytes,
+                       MAX(call_date) AS last_call_date
+                FROM project_dashboard_call
+                GROUP BY endpoint
+            )
+        """)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+import json
+import logging
+from datetime import timedelta
+
+from odoo import SUPERUSER_ID, api, fields, models, tools
+from odoo.tools.speedscope import Speedscope
+
+_logger = logging.getLogger(__name__)
+
+
+class ProjectDashboardProfileRule(models.Model):
+    """Opt-in profiling of one route, optionally for some users only. Calls
+    matching an active rule run under the Odoo profiler (SQL queries and
+    sampled Python stacks); the ones slower than the threshold are stored as
+    speedscope attachments on the rule, see ir.http."""
+    _name = 'project.dashboard.profile.rule'
+    _description = 'Dashboard Profiling Rule'
+    _order = 'route'
+
+    route = fields.Char(required=True,
+                        help="Path of the route, e.g. /get/tiles/data or "
+                             "/web/dataset/call_kw/hr.employee/get_employee_leave_data")
+    user_ids = fields.Many2many('res.users', string='Users',
+                                help="Only profile the calls of these users; all users when empty.")
+    threshold_ms = fields.Integer(string='Threshold (ms)', default=1000, required=True,
+                                  help="Calls slower than this are stored.")
+    max_profiles = fields.Integer(string='Max Profiles', default=20, required=True,
+                                  help="Number of most recent profiles kept.")
+    retention_days = fields.Integer(string='Retention (days)', default=7, required=True)
+    active = fields.Boolean(default=True)
+    profile_count = fields.Integer(compute='_compute_profile_count', string='Profiles')
+
+    def _compute_profile_count(self):
+        counts = dict(self.env['ir.attachment']._read_group(
+            [('res_model', '=', self._name), ('res_id', 'in', self.ids)],
+            ['res_id'], ['__count']))
+        for rule in self:
+            rule.profile_count = counts.get(rule.id, 0)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.env.registry.clear_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env.registry.clear_cache()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env.registry.clear_cache()
+        self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_id', 'in', self.ids),
+        ]).unlink()
+        return super().unlink()
+
+    @api.model
+    @tools.ormcache()
+    def _get_rules_by_route(self):
+        """{route: ((rule_id, threshold_ms, user_ids), ...)} of the active rules."""
+        rules = {}
+        for rule in self.sudo().search([]):
+            rules.setdefault(rule.route, []).append(
+                (rule.id, rule.threshold_ms, frozenset(rule.user_ids.ids)))
+        return {route: tuple(route_rules) for route, route_rules in rules.items()}
+
+    @api.model
+    def _match(self, route, uid):
+        """Return ``(rule_id, threshold_ms)`` of the rule profiling ``route``
+        for ``uid``, or None."""
+        for rule_id, threshold_ms, user_ids in self._get_rules_by_route().get(route, ()):
+            if not user_ids or uid in user_ids:
+                return rule_id, threshold_ms
+        return None
+
+    @api.model
+    def _store_profile(self, rule_id, route, uid, duration_ms, profiler):
+        """Save the speedscope profile of a slow call on its rule, in a
+        separate transaction so that it is kept even if the call's own
+        transaction is read-only or rolled back."""
+        speedscope = Speedscope(init_stack_trace=profiler.init_stack_trace)
+        for collector in profiler.collectors:
+            speedscope.add(collector.name, collector.entries)
+        speedscope.add_output([collector.name for collector in profiler.collectors])
+        now = fields.Datetime.now()
+        with self.env.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env['ir.attachment'].create({
+                'name': '%s %s %dms.speedscope.json' % (
+                    route.strip('/').replace('/', '_'), now.strftime('%Y%m%d-%H%M%S'), duration_ms),
+                'description': 'user %s, %.0f ms' % (uid, duration_ms),
+                'res_model': self._name,
+                'res_id': rule_id,
+                'mimetype': 'application/json',
+                'raw': json.dumps(speedscope.make()).encode(),
+            })
+            env[self._name].browse(rule_id).exists()._apply_retention()
+
+    def _apply_retention(self):
+        Attachment = self.env['ir.attachment'].sudo()
+        for rule in self.with_context(active_test=False):
+            profiles = Attachment.search([
+                ('res_model', '=', self._name),
+                ('res_id', '=', rule.id),
+            ], order='create_date desc, id desc')
+            expired = profiles[rule.max_profiles:] | profiles.filtered(
+                lambda a: a.create_date < fields.Datetime.now() - timedelta(days=rule.retention_days))
+            expired.unlink()
+
+    @api.autovacuum
+    def _gc_profiles(self):
+        self.with_context(active_test=False).search([])._apply_retention()
+
+    def action_view_profiles(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': 'Profiles',
+            'res_model': 'ir.attachment',
+            'view_mode': 'list,form',
+            'domain': [('res_model', '=', self._name), ('res_id', '=', self.id)],
+        }
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+
+class ProjectMarginSummary(models.Model):
+    """Monthly timesheet margin per project, employee and company, kept in a
+    materialized view over the timesheets analysis report. The profitability
+    figures of the dashboard aggregate this view instead of loading every
+    report row; it is refreshed by a scheduled action."""
+    _name = 'project.margin.summary'
+    _description = 'Project Margin Summary'
+    _auto = False
+    _order = 'month desc'
+
+    month = fields.Date(readonly=True)
+    project_id = fields.Many2one('project.project', readonly=True)
+    employee_id = fields.Many2one('hr.employee', readonly=True)
+    company_id = fields.Many2one('res.company', readonly=True)
+    margin = fields.Float(readonly=True)
+
+    def init(self):
+        report_query = self.env['timesheets.analysis.report']._table_query
+        if isinstance(report_query, str):
+            report_query = SQL(report_query)
+        self.env.cr.execute(SQL("DROP MATERIALIZED VIEW IF EXISTS %s", SQL.identifier(self._table)))
+        self.env.cr.execute(SQL("""
+            CREATE MATERIALIZED VIEW %(table)s AS (
+                SELECT ROW_NUMBER() OVER (ORDER BY month, project_id, employee_id, company_id) AS id,
+                       month, project_id, employee_id, company_id, margin
+                FROM (
+                    SELECT DATE_TRUNC('month', report.date)::date AS month,
+                           report.project_id, report.employee_id, report.company_id,
+                           SUM(report.margin) AS margin
+                    FROM (%(report_query)s) report
+                    GROUP BY 1, 2, 3, 4
+                ) summary
+            )
+        """, table=SQL.identifier(self._table), report_query=report_query))
+        # A unique index is required to refresh the view concurrently
+        self.env.cr.execute(SQL("CREATE UNIQUE INDEX %s ON %s (id)",
+                                SQL.identifier(self._table + '_id_index'), SQL.identifier(self._table)))
+        self.env.cr.execute(SQL("CREATE INDEX %s ON %s (project_id, employee_id)",
+                                SQL.identifier(self._table + '_project_employee_index'),
+                                SQL.identifier(self._table)))
+
+    @api.model
+    def _cron_refresh(self):
+        """Refresh the summary without blocking the dashboards reading it."""
+        self.env['account.analytic.line'].flush_model()
+        self.env.cr.execute(SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY %s", SQL.identifier(self._table)))
+        self.invalidate_model()
+
+    @api.model
+    def _get_margin(self, domain):
+        """Total margin of the summary rows matching ``domain``."""
+        [(margin,)] = self._read_group(domain, [], ['margin:sum'])
+        return round(margin or 0, 2)
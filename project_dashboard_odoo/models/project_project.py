@@ -20,7 +20,16 @@
 #
 ###############################################################################
 import random
-from odoo import models
+from odoo import api, models
+
+# status -> chart color, in display order
+PROJECT_STATUS_COLORS = {
+    'new': '#1E90FF',
+    'in_progress': '#FFA500',
+    'completed': '#32CD32',
+    'on_hold': '#808080',
+    'cancelled': '#FF0000',
+}
 
 
 class ProjectProject(models.Model):
@@ -33,3 +42,35 @@ class ProjectProject(models.Model):
         :return: A random color code in the format '#RRGGBB.'"""
         color = f"#{random.randint(0, 0xFFFFFF):06x}"
         return color
+
+    @api.model
+    def get_dashboard_distribution(self):
+        """Count the projects visible to the current user per status and per
+        stage, with one grouped query each.
+        :return: a dictionary with the 'status_list' and 'stage_list' of the
+            dashboard, as lists of {'name', 'projects'} dictionaries; status
+            entries also carry their chart 'color'."""
+        if self.env.user.has_group('project.group_project_manager'):
+            domain = []
+        else:
+            domain = [('user_id', '=', self.env.uid)]
+
+        status_counts = dict(self._read_group(domain, ['status'], ['__count']))
+        status_labels = dict(self._fields['status']._description_selection(self.env))
+        status_list = [{
+            'key': status,
+            'name': status_labels.get(status, status),
+            'projects': status_counts.get(status, 0),
+            'color': color,
+        } for status, color in PROJECT_STATUS_COLORS.items()]
+
+        stage_counts = {
+            stage.id: count
+            for stage, count in self._read_group(domain, ['stage_id'], ['__count'])
+        }
+        stage_list = [{
+            'name': stage.name,
+            'projects': stage_counts.get(stage.id, 0),
+        } for stage in self.env['project.project.stage'].search([])]
+
+        return {'status_list': status_list, 'stage_list': stage_list}
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from odoo import api, fields, models, tools
+
+
+class ProjectTimesheetRollup(models.Model):
+    """Daily timesheet hours summed per project, employee, task, invoice type
+    and company. The hour figures of the dashboards read this table instead
+    of aggregating the raw timesheet lines.
+
+    Rows are refreshed per (date, employee) bucket at the end of every
+    transaction that touches timesheets, and the whole table can be rebuilt
+    with :meth:`_rebuild`."""
+    _name = 'project.timesheet.rollup'
+    _description = 'Project Timesheet Daily Rollup'
+    _order = 'date desc'
+
+    date = fields.Date(required=True, readonly=True)
+    project_id = fields.Many2one('project.project', readonly=True, ondelete='cascade')
+    employee_id = fields.Many2one('hr.employee', readonly=True, ondelete='cascade')
+    task_id = fields.Many2one('project.task', readonly=True, ondelete='cascade')
+    timesheet_invoice_type = fields.Char(readonly=True)
+    company_id = fields.Many2one('res.company', readonly=True, ondelete='cascade')
+    unit_amount = fields.Float(string='Hours', readonly=True)
+
+    def init(self):
+        tools.create_index(self._cr, 'project_timesheet_rollup_date_employee_index',
+                           self._table, ['date', 'employee_id'])
+        tools.create_index(self._cr, 'project_timesheet_rollup_project_date_index',
+                           self._table, ['project_id', 'date'])
+        tools.create_index(self._cr, 'project_timesheet_rollup_task_index',
+                           self._table, ['task_id'])
+
+    @api.model
+    def _mark_timesheets(self, timesheets):
+        """Schedule a refresh of the (date, employee) buckets of ``timesheets``.
+        Called before and after a change so that both the old and the new
+        buckets are refreshed at commit time."""
+        keys = {
+            (line.date, line.employee_id.id or 0)
+            for line in timesheets
+            if line.id and line.date and line.project_id
+        }
+        if not keys:
+            return
+        data = self.env.cr.precommit.data
+        key = 'project_dashboard_odoo.timesheet_rollup_keys'
+        if key not in data:
+            data[key] = set()
+            env = self.env
+
+            @self.env.cr.precommit.add
+            def refresh_timesheet_rollup():
+                env['project.timesheet.rollup'].sudo()._refresh(data.pop(key, set()))
+        data[key].update(keys)
+
+    @api.model
+    def _refresh(self, keys=None):
+        """Recompute the given (date, employee_id) buckets, or all of them."""
+        self.env['account.analytic.line'].flush_model([
+            'date', 'project_id', 'employee_id', 'task_id', 'timesheet_invoice_type', 'company_id', 'unit_amount',
+        ])
+        params = {'uid': self.env.uid}
+        if keys is None:
+            self.env.cr.execute('DELETE FROM project_timesheet_rollup')
+            bucket_filter = 'TRUE'
+        elif not keys:
+            return
+        else:
+            dates, employee_ids = zip(*keys)
+            params.update(dates=list(dates), employee_ids=list(employee_ids))
+            self.env.cr.execute('''
+                DELETE FROM project_timesheet_rollup r
+                USING unnest(%(dates)s::date[], %(employee_ids)s::int[]) AS k(date, employee_id)
+                WHERE r.date = k.date AND COALESCE(r.employee_id, 0) = k.employee_id
+            ''', params)
+            bucket_filter = '''
+                aal.date = ANY(%(dates)s::date[])
+                AND (aal.date, COALESCE(aal.employee_id, 0)) IN (
+                    SELECT * FROM unnest(%(dates)s::date[], %(employee_ids)s::int[])
+                )'''
+        self.env.cr.execute('''
+            INSERT INTO project_timesheet_rollup
+                (date, project_id, employee_id, task_id, timesheet_invoice_type, company_id, unit_amount,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT aal.date, aal.project_id, aal.employee_id, aal.task_id, aal.timesheet_invoice_type,
+                   aal.company_id, SUM(aal.unit_amount),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+            FROM account_analytic_line aal
+            WHERE aal.project_id IS NOT NULL
+              AND {bucket_filter}
+            GROUP BY aal.date, aal.project_id, aal.employee_id, aal.task_id, aal.timesheet_invoice_type,
+                     aal.company_id
+        '''.format(bucket_filter=bucket_filter), params)
+        self.invalidate_model()
+
+    @api.model
+    def _rebuild(self):
+        """Full backfill of the rollup from the timesheet lines."""
+        self._refresh()
@@ -4,7 +4,14 @@ import { useService } from "@web/core/utils/hooks";
 const { Component, onWillStart} = owl
 import { rpc } from "@web/core/network/rpc";
 import { _t } from "@web/core/l10n/translation";
-import { onMounted, useRef, useState} from "@odoo/owl";
+import { onMounted, onWillUnmount, useRef, useState} from "@odoo/owl";
+
+// Live updates published by encode_project_dashboard (see _notify_dashboard_changes)
+const DASHBOARD_BUS_CHANNEL = "encode_project_dashboard";
+const DASHBOARD_BUS_NOTIFICATION = "encode_project_dashboard/changes";
+const CHANGES_DEBOUNCE_DELAY = 3000; // 3 seconds
+// Start loading a widget shortly before it is scrolled into view
+const LAZY_WIDGET_ROOT_MARGIN = "200px";
 
 export class ProjectDashboardComponent extends Component {
     /**
@@ -13,6 +20,9 @@ export class ProjectDashboardComponent extends Component {
 	setup() {
         this.action = useService("action");
         this.orm = useService("orm");
+        this.busService = useService("bus_service");
+        this.charts = {};
+        this.onDashboardChanges = this.onDashboardChanges.bind(this);
 
         this.project_task_doughnut = useRef("project_task_doughnut");
         this.project_doughnut = useRef("project_doughnut");
@@ -30,12 +40,27 @@ export class ProjectDashboardComponent extends Component {
         this.material_requisitions_status = useRef("material_requisitions_status");
         this.gantt_chart = useRef("gantt_chart");
         this.rfq_cumulative_chart = useRef("rfq_cumulative_chart");
+        this.task_table = useRef("task_table");
+
+        // Widgets below the tiles: each one fetches its data the first time
+        // its element becomes visible (see observeWidgets).
+        this.lazyWidgets = {
+            project_status: { ref: this.project_doughnut, load: (reload) => this.render_project(reload) },
+            project_task: { ref: this.project_task_doughnut, load: () => this.render_project_task() },
+            top_employees: { ref: this.top_selling_employees, load: () => this.render_top_employees_graph() },
+            material_requisitions: { ref: this.material_requisitions_status, load: () => this.render_material_requisitions_status_graph() },
+            rfq_cumulative: { ref: this.rfq_cumulative_chart, load: () => this.render_rfq_cumulative_chart() },
+            gantt: { ref: this.gantt_chart, load: () => this.render_gantt_chart() },
+            task_table: { ref: this.task_table, load: () => this.load_task_data() },
+        };
+        this.loadedWidgets = new Set();
 
 
 		this.state = useState({
             projects : '',
             employees: "",
             stages: '',
+            task_data: [],
         });
 
         onWillStart(async () => {
@@ -44,10 +69,79 @@ export class ProjectDashboardComponent extends Component {
 
         onMounted(async () => {
             await this.mounted();
+            this.busService.addChannel(DASHBOARD_BUS_CHANNEL);
+            this.busService.subscribe(DASHBOARD_BUS_NOTIFICATION, this.onDashboardChanges);
+        });
+
+        onWillUnmount(() => {
+            clearTimeout(this.changesTimeout);
+            if (this.widgetObserver) {
+                this.widgetObserver.disconnect();
+            }
+            this.busService.unsubscribe(DASHBOARD_BUS_NOTIFICATION, this.onDashboardChanges);
+            this.busService.deleteChannel(DASHBOARD_BUS_CHANNEL);
+            Object.values(this.charts).forEach((chart) => chart.destroy());
         });
     }
 
 
+	/**
+     * Bus handler: a task, timesheet, budget line or material requisition of
+     * some projects changed. Bursts are coalesced, then only the charts fed by
+     * those records are refetched and redrawn, if they were already loaded.
+     */
+	onDashboardChanges(payload) {
+		clearTimeout(this.changesTimeout);
+		this.changesTimeout = setTimeout(() => {
+			for (const key of ["project_status", "project_task", "material_requisitions", "rfq_cumulative"]) {
+				if (this.loadedWidgets.has(key)) {
+					this.lazyWidgets[key].load(true);
+				}
+			}
+		}, CHANGES_DEBOUNCE_DELAY);
+	}
+
+
+	/**
+     * Load each widget present in the template once it gets close to the
+     * viewport, so the initial load only covers the tiles.
+     */
+	observeWidgets() {
+		this.widgetObserver = new IntersectionObserver((entries) => {
+			for (const entry of entries) {
+				if (!entry.isIntersecting) {
+					continue;
+				}
+				this.widgetObserver.unobserve(entry.target);
+				for (const [key, widget] of Object.entries(this.lazyWidgets)) {
+					if (widget.ref.el === entry.target && !this.loadedWidgets.has(key)) {
+						this.loadedWidgets.add(key);
+						widget.load();
+					}
+				}
+			}
+		}, { rootMargin: LAZY_WIDGET_ROOT_MARGIN });
+		for (const widget of Object.values(this.lazyWidgets)) {
+			if (widget.ref.el) {
+				this.widgetObserver.observe(widget.ref.el);
+			}
+		}
+	}
+
+
+	/**
+     * Draw a chart on the given canvas, replacing the one previously drawn
+     * under the same key so that refreshes do not stack charts.
+     */
+	_drawChart(key, canvas, config) {
+		if (this.charts[key]) {
+			this.charts[key].destroy();
+		}
+		this.charts[key] = new Chart(canvas, config);
+		return this.charts[key];
+	}
+
+
 	/**
      * Event handler for the 'onWillStart' event.
      */
@@ -58,17 +152,11 @@ export class ProjectDashboardComponent extends Component {
 
 	 /**
      * Event handler for the 'onMounted' event.
-     * Renders various components and charts after fetching data.
+     * Renders the filters; charts and tables load as they become visible.
      */
 	async mounted() {
-		// Render other components after fetching data
-		this.render_project();
-		this.render_project_task();
-		this.render_top_employees_graph();
-		this.render_material_requisitions_status_graph();
-        this.render_gantt_chart();
-        this.render_rfq_cumulative_chart();
 		this.render_filter();
+		this.observeWidgets();
 	}
 
 
@@ -78,7 +166,7 @@ export class ProjectDashboardComponent extends Component {
 	async render_project_task() {
 		var datas = await rpc("/project/task/count")
         var ctx = this.project_task_doughnut;
-        const chart = new Chart(this.project_task_doughnut.el, {
+        const chart = this._drawChart("project_task", this.project_task_doughnut.el, {
             type: "doughnut",
             data: {
                 labels: datas.project,
@@ -171,18 +259,23 @@ export class ProjectDashboardComponent extends Component {
 
     // ///////////////////////////// By Elian  /////////////////////////////
     /**
-     * Render the project chart.
+     * Render the project chart. The status counts loaded with the tiles are
+     * reused; they are only refetched when `reload` is set.
      */
-	async render_project() {
-		var datas = await rpc("/project/count")
+	async render_project(reload = false) {
+		if (reload || !this.project_status_list) {
+			var datas = await rpc("/project/count")
+			this.project_status_list = datas.status_list;
+		}
+		const statusList = this.project_status_list;
         var ctx = this.project_doughnut;
-        const chart = new Chart(this.project_doughnut.el, {
+        const chart = this._drawChart("project_status", this.project_doughnut.el, {
             type: "doughnut",
             data: {
-                labels: datas.labels,
+                labels: statusList.map((status) => status.name),
                 datasets: [{
-                    backgroundColor: datas.colors,
-                    data: datas.data
+                    backgroundColor: statusList.map((status) => status.color),
+                    data: statusList.map((status) => status.projects)
                 }]
             },
             options: {
@@ -250,7 +343,7 @@ export class ProjectDashboardComponent extends Component {
         }
     };
 
-    new Chart(ctx.el, {
+    this._drawChart("material_requisitions_status", ctx.el, {
         type: 'bar',
         data: data,
         options: options
@@ -414,7 +507,7 @@ export class ProjectDashboardComponent extends Component {
             }
 
 
-            new Chart(ctx.el, {
+            this._drawChart("rfq_cumulative", ctx.el, {
                 type: 'line',
                 data: {
                     labels: result.labels,  // e.g., ['2024-01', '2024-02']
@@ -542,6 +635,15 @@ export class ProjectDashboardComponent extends Component {
     }
 
 
+	/**
+	function for getting values to the project task table
+	*/
+	async load_task_data() {
+		const res = await rpc('/get/task/data');
+		this.state.task_data = res['project'];
+	}
+
+
 	/**
 	function for getting values when page is loaded
 	*/
@@ -575,22 +677,7 @@ export class ProjectDashboardComponent extends Component {
 				self.total_projects_ids = result['total_projects_ids']
 			}
 		});
-		/**
-		function for getting values to hours table
-		*/
-		var def3 = rpc('/get/hours')
-			.then(function(res) {
-				self.hour_recorded = res['hour_recorded'];
-				self.hour_recorde = res['hour_recorde'];
-				self.billable_fix = res['billable_fix'];
-				self.non_billable = res['non_billable'];
-				self.total_hr = res['total_hr'];
-			});
-		var def4 = rpc('/get/task/data')
-			.then(function(res) {
-				self.task_data = res['project'];
-			});
-			return Promise.all([def1, def3, def4])
+			return Promise.all([def1])
         .then(() => {
             console.log('All data has been fetched successfully.');
         })
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+
+from odoo import Command, fields
+from odoo.tests import HttpCase
+
+_logger = logging.getLogger(__name__)
+
+# Number of records generated per profile, selected with DASHBOARD_BENCH_SCALE.
+# Each count can be overridden with DASHBOARD_BENCH_<KEY>, e.g.
+# DASHBOARD_BENCH_TASKS_PER_PROJECT=100.
+SCALE_PROFILES = {
+    'small': {
+        'companies': 1,
+        'employees_per_company': 5,
+        'projects_per_company': 5,
+        'tasks_per_project': 10,
+        'timesheets_per_task': 5,
+        'requisitions_per_project': 3,
+        'vendor_bills': 10,
+        'attendance_days': 20,
+    },
+    'medium': {
+        'companies': 2,
+        'employees_per_company': 20,
+        'projects_per_company': 20,
+        'tasks_per_project': 30,
+        'timesheets_per_task': 10,
+        'requisitions_per_project': 10,
+        'vendor_bills': 100,
+        'attendance_days': 60,
+    },
+    'large': {
+        'companies': 3,
+        'employees_per_company': 50,
+        'projects_per_company': 50,
+        'tasks_per_project': 60,
+        'timesheets_per_task': 20,
+        'requisitions_per_project': 20,
+        'vendor_bills': 500,
+        'attendance_days': 120,
+    },
+}
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_baselines.json')
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_benchmark_config():
+    """Read the benchmark settings from the environment."""
+    scale = os.environ.get('DASHBOARD_BENCH_SCALE', 'small')
+    counts = dict(SCALE_PROFILES.get(scale, SCALE_PROFILES['small']))
+    for key in counts:
+        value = os.environ.get('DASHBOARD_BENCH_%s' % key.upper())
+        if value and value.isdigit():
+            counts[key] = int(value)
+    return {
+        'scale': scale,
+        'counts': counts,
+        'repeat': max(int(_env_float('DASHBOARD_BENCH_REPEAT', 3)), 1),
+        'query_tolerance': _env_float('DASHBOARD_BENCH_QUERY_TOLERANCE', 0.10),
+        'latency_tolerance': _env_float('DASHBOARD_BENCH_LATENCY_TOLERANCE', 0.50),
+        'report_path': os.environ.get('DASHBOARD_BENCH_REPORT') or os.path.join(
+            tempfile.gettempdir(), 'dashboard_benchmark_%s.json' % scale),
+        'update_baselines': os.environ.get('DASHBOARD_BENCH_UPDATE_BASELINES') == '1',
+    }
+
+
+class DashboardDataGenerator:
+    """Create synthetic companies with projects, tasks, timesheets,
+    requisitions, vendor bills, employees and attendances. Records are
+    created with one batched create per model and company; models of addons
+    that are not installed are skipped."""
+
+    def __init__(self, env, counts):
+        self.env = env
+        self.counts = counts
+        self.today = fields.Date.today()
+
+    def generate(self):
+        companies = self.env['res.company'].create([
+            {'name': 'Benchmark Company %s' % index}
+            for index in range(self.counts['companies'])
+        ])
+        self.env.user.write({'company_ids': [Command.link(company.id) for company in companies]})
+        product = self.env['product.product'].create({
+            'name': 'Benchmark Material',
+            'type': 'consu',
+            'purchase_ok': True,
+        })
+        vendor = self.env['res.partner'].create({'name': 'Benchmark Vendor', 'supplier_rank': 1})
+
+        result = {
+            'companies': companies,
+            'employees': self.env['hr.employee'],
+            'projects': self.env['project.project'],
+            'tasks': self.env['project.task'],
+            'product': product,
+        }
+        for company in companies:
+            env = self.env(context=dict(self.env.context, allowed_company_ids=[company.id]))
+            employees = self._generate_employees(env, company)
+            projects = self._generate_projects(env, company)
+            tasks = self._generate_tasks(env, projects)
+            self._generate_timesheets(env, tasks, employees)
+            self._generate_requisitions(env, projects, product, vendor)
+            self._generate_attendances(env, employees)
+            result['employees'] |= employees
+            result['projects'] |= projects
+            result['tasks'] |= tasks
+        self._generate_vendor_bills(product, vendor)
+
+        # The rollups are refreshed by precommit hooks, which tests never
+        # reach by committing; the margin summary is refreshed by a cron.
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        if 'project.margin.summary' in self.env:
+            self.env['project.margin.summary']._cron_refresh()
+        return result
+
+    def _generate_employees(self, env, company):
+        return env['hr.employee'].create([{
+            'name': 'Benchmark Employee %s-%s' % (company.id, index),
+            'company_id': company.id,
+        } for index in range(self.counts['employees_per_company'])])
+
+    def _generate_projects(self, env, company):
+        statuses = ['new', 'in_progress', 'completed', 'on_hold', 'cancelled']
+        Project = env['project.project']
+        vals_list = []
+        for index in range(self.counts['projects_per_company']):
+            vals = {
+                'name': 'Benchmark Project %s-%s' % (company.id, index),
+                'company_id': company.id,
+                'allow_timesheets': True,
+            }
+            if 'status' in Project._fields:
+                vals['status'] = statuses[index % len(statuses)]
+            vals_list.append(vals)
+        return Project.create(vals_list)
+
+    def _generate_tasks(self, env, projects):
+        Task = env['project.task']
+        has_planning = 'planned_date_begin' in Task._fields
+        start = fields.Datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        vals_list = []
+        for project in projects:
+            for index in range(self.counts['tasks_per_project']):
+                vals = {
+                    'name': 'Benchmark Task %s' % index,
+                    'project_id': project.id,
+                    'date_deadline': start + timedelta(days=index * 3 + 2),
+                }
+                if has_planning:
+                    vals['planned_date_begin'] = start + timedelta(days=index * 3)
+                vals_list.append(vals)
+        return Task.create(vals_list)
+
+    def _generate_timesheets(self, env, tasks, employees):
+        if not employees:
+            return
+        vals_list = []
+        for task_index, task in enumerate(tasks):
+            for index in range(self.counts['timesheets_per_task']):
+                vals_list.append({
+                    'name': '/',
+                    'project_id': task.project_id.id,
+                    'task_id': task.id,
+                    'employee_id': employees[(task_index + index) % len(employees)].id,
+                    'unit_amount': 1 + (index % 8),
+                    'date': self.today - timedelta(days=(task_index + index) % 365),
+                })
+        env['account.analytic.line'].create(vals_list)
+
+    def _generate_requisitions(self, env, projects, product, vendor):
+        if 'material.requisition' not in env:
+            return
+        states = ['draft', 'waiting', 'approved', 'approved', 'cancelled']
+        vals_list = []
+        for project in projects:
+            for index in range(self.counts['requisitions_per_project']):
+                vals_list.append({
+                    'project_id': project.id,
+                    'state': states[index % len(states)],
+                    'date': fields.Datetime.now() - timedelta(days=index * 15),
+                    'line_ids': [Command.create({
+                        'product_id': product.id,
+                        'product_uom_qty': 1 + index,
+                        'cost': 10.0,
+                        'vendor_id': vendor.id,
+                    })],
+                })
+        requisitions = env['material.requisition'].create(vals_list)
+        approved = requisitions.filtered(lambda r: r.state == 'approved')
+        if approved:
+            approved[::2]._create_rfqs()
+
+    def _generate_attendances(self, env, employees):
+        if 'hr.attendance' not in env or not employees:
+            return
+        vals_list = []
+        now = fields.Datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        for employee in employees:
+            for day in range(1, self.counts['attendance_days'] + 1):
+                check_in = now - timedelta(days=day)
+                vals_list.append({
+                    'employee_id': employee.id,
+                    'check_in': check_in,
+                    'check_out': check_in + timedelta(hours=8),
+                })
+        env['hr.attendance'].create(vals_list)
+
+    def _generate_vendor_bills(self, product, vendor):
+        """Posted vendor bills in the current company; skipped when it has no
+        purchase journal (no chart of accounts installed)."""
+        if not self.counts['vendor_bills']:
+            return
+        journal = self.env['account.journal'].search([
+            ('type', '=', 'purchase'),
+            ('company_id', '=', self.env.company.id),
+        ], limit=1)
+        if not journal:
+            _logger.info("Dashboard benchmark: no purchase journal, vendor bills skipped")
+            return
+        bills = self.env['account.move'].create([{
+            'move_type': 'in_invoice',
+            'partner_id': vendor.id,
+            'journal_id': journal.id,
+            'invoice_date': self.today - timedelta(days=index % 300),
+            'invoice_line_ids': [Command.create({
+                'product_id': product.id,
+                'quantity': 1,
+                'price_unit': 10.0 + index % 7,
+            })],
+        } for index in range(self.counts['vendor_bills'])])
+        bills.action_post()
+
+
+class DashboardBenchmarkCase(HttpCase):
+    """Base class of the benchmarks: generates the synthetic data once per
+    class, measures cases with :meth:`measure` and writes the JSON report
+    when the class is done."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.config = get_benchmark_config()
+        cls.results = {}
+        started = time.perf_counter()
+        cls.data = DashboardDataGenerator(cls.env, cls.config['counts']).generate()
+        cls.generation_time = time.perf_counter() - started
+        with open(BASELINES_PATH) as baselines_file:
+            cls.baselines = json.load(baselines_file).get(cls.config['scale'], {})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._write_report()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate('admin', 'admin')
+        # Make the synthetic companies active for the HTTP requests
+        company_ids = [self.env.company.id] + self.data['companies'].ids
+        self.opener.cookies['cids'] = '-'.join(str(cid) for cid in company_ids)
+
+    def jsonrpc(self, route, params=None):
+        return lambda: self.make_jsonrpc_request(route, params or {})
+
+    def call_kw(self, model, method, args=None, kwargs=None):
+        return self.jsonrpc('/web/dataset/call_kw/%s/%s' % (model, method), {
+            'model': model,
+            'method': method,
+            'args': args or [],
+            'kwargs': kwargs or {},
+        })
+
+    def measure(self, name, func, check_result=True):
+        """Run ``func`` once to warm up, then ``repeat`` times with cold ORM
+        caches; record the median latency and the query count of the last
+        run, and fail when they regress past the tolerances of the stored
+        baseline. Cases without a baseline are only reported and skipped; a
+        baseline without ``ms`` only checks the query count. With
+        ``check_result``, the warm-up result must not be empty."""
+        payload = func()
+        if check_result:
+            self.assertTrue(payload, "%s returned an empty result" % name)
+        durations = []
+        queries = 0
+        for _i in range(self.config['repeat']):
+            self.env.flush_all()
+            self.env.invalidate_all()
+            count_before = self.cr.sql_log_count
+            started = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - started) * 1000)
+            queries = self.cr.sql_log_count - count_before
+        result = {'queries': queries, 'ms': round(statistics.median(durations), 2)}
+        type(self).results[name] = result
+        _logger.info("Dashboard benchmark %s: %s queries, %.2f ms", name, queries, result['ms'])
+
+        if self.config['update_baselines']:
+            return result
+        baseline = self.baselines.get(name)
+        if not baseline:
+            self.skipTest("%s: no baseline for scale %s, record them with DASHBOARD_BENCH_UPDATE_BASELINES=1"
+                          % (name, self.config['scale']))
+        result['baseline'] = baseline
+        max_queries = baseline['queries'] * (1 + self.config['query_tolerance'])
+        self.assertLessEqual(
+            queries, max_queries,
+            "%s: %s queries, baseline %s" % (name, queries, baseline['queries']))
+        if 'ms' in baseline:
+            max_ms = baseline['ms'] * (1 + self.config['latency_tolerance'])
+            self.assertLessEqual(
+                result['ms'], max_ms,
+                "%s: %.2f ms, baseline %.2f ms" % (name, result['ms'], baseline['ms']))
+        return result
+
+    @classmethod
+    def _write_report(cls):
+        report = {
+            'scale': cls.config['scale'],
+            'counts': cls.config['counts'],
+            'repeat': cls.config['repeat'],
+            'generation_ms': round(cls.generation_time * 1000, 2),
+            'results': cls.results,
+        }
+        with open(cls.config['report_path'], 'w') as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+        _logger.info("Dashboard benchmark report written to %s", cls.config['report_path'])
+
+        if cls.config['update_baselines'] and cls.results:
+            with open(BASELINES_PATH) as baselines_file:
+                baselines = json.load(baselines_file)
+            baselines[cls.config['scale']] = {
+                name: {'queries': result['queries'], 'ms': result['ms']}
+                for name, result in sorted(cls.results.items())
+            }
+            with open(BASELINES_PATH, 'w') as baselines_file:
+                json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+                baselines_file.write('\n')
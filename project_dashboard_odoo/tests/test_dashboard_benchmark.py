@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from datetime import timedelta
+
+from odoo.tests import tagged
+
+from .common import DashboardBenchmarkCase
+
+
+@tagged('-standard', 'dashboard_benchmark', 'post_install', '-at_install')
+class TestDashboardBenchmark(DashboardBenchmarkCase):
+    """Query counts and latencies of the dashboard endpoints on synthetic
+    data. Run with ``--test-tags dashboard_benchmark``; see README.rst for
+    the scale profiles, the JSON report and the stored baselines."""
+
+    def test_project_filter_routes(self):
+        """Every route of the ProjectFilter controller."""
+        project = self.data['projects'][:1]
+        today = self.data['tasks'][:1].date_deadline.date()
+        routes = [
+            ('/project/task/count', {}),
+            ('/employee/timesheet', {}),
+            ('/employee/timesheet', {
+                'date_from': str(today.replace(day=1)),
+                'date_to': str(today),
+            }),
+            ('/project/count', {}),
+            ('/dashboard/material_requisition_data', {}),
+            ('/dashboard/task_gantt_data', {}),
+            ('/dashboard/task_stages', {}),
+            ('/dashboard/rfq_cumulative_data', {}),
+            ('/project/filter', {}),
+            ('/project/filter-apply', {'data': {
+                'start_date': 'null',
+                'end_date': 'null',
+                'project': str(project.id),
+                'employee': 'null',
+            }}),
+            ('/get/tiles/data', {}),
+            ('/get/hours', {}),
+            ('/get/task/data', {}),
+        ]
+        for route, params in routes:
+            name = route + ('?' + ','.join(sorted(params)) if params else '')
+            with self.subTest(route=name):
+                self.measure(name, self.jsonrpc(route, params))
+
+    def test_project_dashboard_data(self):
+        """encode_project_dashboard's payload of all projects."""
+        Project = self.env['project.project']
+        if not hasattr(Project, 'get_all_dashboard_data'):
+            self.skipTest("encode_project_dashboard is not installed")
+        self.measure('project.project.get_all_dashboard_data',
+                     self.call_kw('project.project', 'get_all_dashboard_data'))
+
+    def test_employee_leave_data(self):
+        """advance_hr_attendance_dashboard's attendance sheet."""
+        if not hasattr(self.env['hr.employee'], 'get_employee_leave_data'):
+            self.skipTest("advance_hr_attendance_dashboard is not installed")
+        self.measure('hr.employee.get_employee_leave_data',
+                     self.call_kw('hr.employee', 'get_employee_leave_data', ['this_month']))
+
+    def test_update_all_product_costs(self):
+        """encode_re_development's product cost cron."""
+        ProductTemplate = self.env['product.template']
+        if not hasattr(ProductTemplate, '_update_all_product_costs'):
+            self.skipTest("encode_re_development is not installed")
+        self.measure('product.template._update_all_product_costs',
+                     ProductTemplate._update_all_product_costs, check_result=False)
+
+    def test_task_rescheduling(self):
+        """Moving the first task of a project shifts all the following ones
+        (encode_re_development's sequential rescheduling)."""
+        Task = self.env['project.task']
+        if 'task_duration' not in Task._fields or 'planned_date_begin' not in Task._fields:
+            self.skipTest("encode_re_development is not installed")
+        project = self.data['projects'][:1]
+        first_task = Task.search([
+            ('project_id', '=', project.id),
+            ('parent_id', '=', False),
+        ], order='planned_date_begin asc', limit=1)
+
+        def reschedule():
+            first_task.write({
+                'planned_date_begin': first_task.planned_date_begin + timedelta(days=1),
+                'date_deadline': first_task.date_deadline + timedelta(days=1),
+            })
+
+        self.measure('project.task.write[reschedule]', reschedule, check_result=False)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2023-TODAY Cybrosys Technologies(<https://www.cybrosys.com>).
+#    Author: Nihala KP @cybrosys(odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU AFFERO
+#    GENERAL PUBLIC LICENSE (AGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU AFFERO GENERAL PUBLIC LICENSE (AGPL v3) for more details.
+#
+#    You should have received a copy of the GNU AFFERO GENERAL PUBLIC LICENSE
+#    (AGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+from odoo.tests import HttpCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardProfiling(HttpCase):
+    """Calls of a route with an active profiling rule are stored as
+    speedscope attachments on the rule when slower than its threshold."""
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate('admin', 'admin')
+
+    def _profiles(self, rule):
+        return self.env['ir.attachment'].search([
+            ('res_model', '=', rule._name),
+            ('res_id', '=', rule.id),
+        ])
+
+    def test_slow_call_is_stored(self):
+        rule = self.env['project.dashboard.profile.rule'].create({
+            'route': '/project/task/count',
+            'threshold_ms': 0,
+        })
+        self.make_jsonrpc_request('/project/task/count', {})
+        profiles = self._profiles(rule)
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual(profiles.mimetype, 'application/json')
+        self.assertIn(b'"profiles"', profiles.raw)
+        self.assertEqual(rule.profile_count, 1)
+
+    def test_fast_call_is_not_stored(self):
+        rule = self.env['project.dashboard.profile.rule'].create({
+            'route': '/project/task/count',
+            'threshold_ms': 3600000,
+        })
+        self.make_jsonrpc_request('/project/task/count', {})
+        self.assertFalse(self._profiles(rule))
+
+    def test_other_user_is_not_profiled(self):
+        rule = self.env['project.dashboard.profile.rule'].create({
+            'route': '/project/task/count',
+            'threshold_ms': 0,
+            'user_ids': [(4, self.env.ref('base.public_user').id)],
+        })
+        self.make_jsonrpc_request('/project/task/count', {})
+        self.assertFalse(self._profiles(rule))